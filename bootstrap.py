@@ -22,25 +22,46 @@ from __future__ import annotations
 
 import argparse
 import os
-import platform
-import shutil
+import re
 import subprocess
 import sys
 import time
 from pathlib import Path
 
+# platform and shutil are imported lazily (Colors.init / cmd_clean) to
+# keep the script's cold-start cost down.
+
 # ============================================================
 # CONSTANTS
 # ============================================================
 
 ROOT_DIR = Path(__file__).parent.resolve()
 
+# Set from --offline (or auto-detected vendor dir) in main().
+OFFLINE = False
+
 TEST_FILES = {
     "chess3": "data/chess3.abc",
     "chess4": "data/chess4.abc",
     "bmw": "data/bmw.abc",
 }
 
+# libtest per-test result line, with the optional --report-time suffix.
+TEST_TIME_RE = re.compile(r"test (\S+) \.\.\. ok <(\d+(?:\.\d+)?)s>")
+
+# Summary lines worth surfacing from the BMW geometry scan output.
+BENCH_KEYWORDS_RE = re.compile(r"Total|vertices|faces")
+
+# Per-subcommand target dirs: switching profiles/targets in a shared
+# target/ invalidates fingerprints and forces re-links, so each command
+# keeps its own cache (build and bench share the release profile).
+TARGET_DIRS = {
+    "test": "target/test",
+    "build": "target/build",
+    "check": "target/check",
+    "bench": "target/build",
+}
+
 
 # ============================================================
 # COLORS
@@ -48,19 +69,31 @@ TEST_FILES = {
 
 class Colors:
     """ANSI color codes."""
-    
+
     RESET = "\033[0m"
     RED = "\033[91m"
     GREEN = "\033[92m"
     YELLOW = "\033[93m"
     CYAN = "\033[96m"
     WHITE = "\033[97m"
-    
+
+    _inited = False
+
     @classmethod
     def init(cls) -> None:
-        """Enable ANSI on Windows."""
+        """Enable ANSI on Windows (direct Win32 call, no shell fork)."""
+        if cls._inited:
+            return
+        cls._inited = True
+        import platform
         if platform.system() == "Windows":
-            os.system("")
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+            mode = ctypes.c_ulong()
+            if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+                # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+                kernel32.SetConsoleMode(handle, mode.value | 0x0004)
 
 
 # ============================================================
@@ -94,42 +127,115 @@ def print_subheader(text: str) -> None:
     print(f"{Colors.YELLOW}[{text}]{Colors.RESET}")
 
 
-def run_cmd(args: list[str], quiet: bool = False, capture: bool = False) -> tuple[int, str]:
+def run_cmd(args: list[str], quiet: bool = False, capture: bool = False,
+            env: dict | None = None) -> tuple[int, str]:
     """Run command and return (exit_code, output)."""
+    if env is None:
+        env = cargo_env()
+    if capture:
+        # Keep cargo's colors when going through a pipe.
+        env = {**env, "CARGO_TERM_COLOR": "always"}
     try:
         if capture:
-            result = subprocess.run(args, cwd=ROOT_DIR, capture_output=True, text=True)
+            result = subprocess.run(args, cwd=ROOT_DIR, capture_output=True, text=True, env=env)
             return result.returncode, result.stdout + result.stderr
         else:
-            result = subprocess.run(args, cwd=ROOT_DIR)
+            result = subprocess.run(args, cwd=ROOT_DIR, env=env)
             return result.returncode, ""
     except Exception as e:
         return 1, str(e)
 
 
+def spawn_cmd(args: list[str], env: dict | None = None, capture: bool = False) -> subprocess.Popen:
+    """Spawn command without blocking; caller wait()s on the returned Popen."""
+    if capture:
+        return subprocess.Popen(
+            args, cwd=ROOT_DIR, env=env,
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+        )
+    return subprocess.Popen(args, cwd=ROOT_DIR, env=env)
+
+
+def run_cmd_filtered(args: list[str], pattern: re.Pattern,
+                     env: dict | None = None) -> int:
+    """Run command, streaming only lines that match `pattern`.
+
+    Avoids buffering the whole output in memory and prints matches as
+    they arrive instead of after the subprocess exits; the pre-compiled
+    regex does one C-level scan per line.
+    """
+    if env is None:
+        env = cargo_env()
+    try:
+        proc = subprocess.Popen(
+            args, cwd=ROOT_DIR, env=env,
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1,
+        )
+        for line in proc.stdout:
+            if pattern.search(line):
+                print(f"  {line.strip()}")
+        return proc.wait()
+    except Exception as e:
+        print(f"  {e}")
+        return 1
+
+
+def cargo_cmd(*args: str, quiet: bool = True) -> list[str]:
+    """Build a cargo command line with the uniform -q/--offline flags."""
+    cmd = ["cargo", *args]
+    if quiet:
+        cmd.append("-q")
+    if OFFLINE:
+        cmd.append("--offline")
+    return cmd
+
+
+def cargo_env(target_dir: str | None = None) -> dict:
+    """Environment for a cargo subprocess, optionally with its own target dir."""
+    env = {**os.environ, "CARGO_INCREMENTAL": "0"}
+    if target_dir:
+        env["CARGO_TARGET_DIR"] = str(ROOT_DIR / target_dir)
+    return env
+
+
 # ============================================================
 # COMMANDS
 # ============================================================
 
-def cmd_test(verbose: bool = False) -> int:
-    """Run all tests."""
+def cmd_test(verbose: bool = False, jobs: int = 2) -> int:
+    """Run all tests (unit + integration in parallel when jobs >= 2)."""
     print_header("ALEMBIC-RS TESTS")
-    
-    start = time.time()
-    
-    print_subheader("Unit Tests")
-    if verbose:
-        code1, _ = run_cmd(["cargo", "test", "--lib", "--", "--nocapture"])
-    else:
-        code1, _ = run_cmd(["cargo", "test", "--lib"])
-    
-    print_subheader("Integration Tests")
+
+    start = time.perf_counter()
+
+    unit_args = cargo_cmd("test", "--lib", quiet=not verbose)
+    it_args = cargo_cmd("test", "--test", "read_files", quiet=not verbose)
     if verbose:
-        code2, _ = run_cmd(["cargo", "test", "--test", "read_files", "--", "--nocapture"])
+        unit_args += ["--", "--nocapture"]
+        it_args += ["--", "--nocapture"]
+
+    if jobs >= 2:
+        # Separate target dirs so the two cargo invocations don't fight
+        # over the build lock.
+        p1 = spawn_cmd(unit_args, env=cargo_env("target/lib"), capture=True)
+        p2 = spawn_cmd(it_args, env=cargo_env("target/it"), capture=True)
+        out1, _ = p1.communicate()
+        out2, _ = p2.communicate()
+        code1, code2 = p1.returncode, p2.returncode
+
+        # Print per-job output after completion to avoid interleaving.
+        print_subheader("Unit Tests")
+        print(out1, end="")
+        print_subheader("Integration Tests")
+        print(out2, end="")
     else:
-        code2, _ = run_cmd(["cargo", "test", "--test", "read_files"])
-    
-    elapsed = (time.time() - start) * 1000
+        print_subheader("Unit Tests")
+        code1, _ = run_cmd(unit_args)
+
+        print_subheader("Integration Tests")
+        code2, _ = run_cmd(it_args)
+
+    elapsed = (time.perf_counter() - start) * 1000
     
     print_header("RESULTS")
     print()
@@ -143,13 +249,13 @@ def cmd_test(verbose: bool = False) -> int:
     return 0 if code1 == 0 and code2 == 0 else 1
 
 
-def cmd_build() -> int:
+def cmd_build(verbose: bool = False) -> int:
     """Build release."""
     print_header("BUILD RELEASE")
-    
-    start = time.time()
-    code, _ = run_cmd(["cargo", "build", "--release"])
-    elapsed = (time.time() - start) * 1000
+
+    start = time.perf_counter()
+    code, _ = run_cmd(cargo_cmd("build", "--release", quiet=not verbose))
+    elapsed = (time.perf_counter() - start) * 1000
     
     print()
     if code == 0:
@@ -162,16 +268,33 @@ def cmd_build() -> int:
     return code
 
 
-def cmd_check() -> int:
-    """Run cargo check + clippy."""
+def cmd_check(jobs: int = 2) -> int:
+    """Run cargo check + clippy (in parallel when jobs >= 2)."""
     print_header("CHECK + CLIPPY")
-    
-    print_subheader("cargo check")
-    code1, _ = run_cmd(["cargo", "check"])
-    
-    print_subheader("cargo clippy")
-    code2, _ = run_cmd(["cargo", "clippy", "--", "-D", "warnings"])
-    
+
+    check_args = cargo_cmd("check")
+    clippy_args = cargo_cmd("clippy") + ["--", "-D", "warnings"]
+
+    if jobs >= 2:
+        # Own target dirs: clippy would otherwise invalidate check's
+        # fingerprints (different RUSTFLAGS) and serialize on the lock.
+        p1 = spawn_cmd(check_args, env=cargo_env("target/check"), capture=True)
+        p2 = spawn_cmd(clippy_args, env=cargo_env("target/clippy"), capture=True)
+        out1, _ = p1.communicate()
+        out2, _ = p2.communicate()
+        code1, code2 = p1.returncode, p2.returncode
+
+        print_subheader("cargo check")
+        print(out1, end="")
+        print_subheader("cargo clippy")
+        print(out2, end="")
+    else:
+        print_subheader("cargo check")
+        code1, _ = run_cmd(check_args)
+
+        print_subheader("cargo clippy")
+        code2, _ = run_cmd(clippy_args)
+
     print()
     if code1 == 0 and code2 == 0:
         print(f"  {Colors.GREEN}All checks passed!{Colors.RESET}")
@@ -182,59 +305,152 @@ def cmd_check() -> int:
     return 0 if code1 == 0 and code2 == 0 else 1
 
 
+def build_test_binary(test_name: str = "read_files") -> str | None:
+    """Build the integration test binary once and return its path."""
+    import json
+
+    code, output = run_cmd(
+        cargo_cmd("test", "--no-run", "--release", "--test", test_name,
+                  "--message-format=json"),
+        capture=True,
+    )
+    if code != 0:
+        return None
+
+    for line in output.splitlines():
+        try:
+            msg = json.loads(line)
+        except ValueError:
+            continue
+        if (msg.get("executable")
+                and msg.get("profile", {}).get("test")
+                and msg.get("target", {}).get("name") == test_name):
+            return msg["executable"]
+    return None
+
+
 def cmd_bench() -> int:
     """Benchmark file reading."""
     print_header("BENCHMARK FILE READING")
-    
-    print_subheader("Building release")
-    run_cmd(["cargo", "build", "--release", "--quiet"])
-    
+
+    print_subheader("Building test binary")
+    test_bin = build_test_binary()
+    if test_bin is None:
+        print(f"  {Colors.RED}Failed to build test binary{Colors.RESET}")
+        return 1
+
     print_subheader("Reading test files")
-    
+
+    # Batch all file reads into a single test-binary invocation; libtest
+    # runs the filtered tests on its own thread pool, so the reads still
+    # overlap but cargo/binary startup is paid once.
+    sizes = {}
     for name, rel_path in TEST_FILES.items():
         path = ROOT_DIR / rel_path
-        if not path.exists():
+        # Single stat() covers both the existence check and the size.
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
             print(f"  {name}... {Colors.YELLOW}SKIP (file not found){Colors.RESET}")
             continue
-        
-        size_mb = path.stat().st_size / (1024 * 1024)
-        print(f"  {name} ({size_mb:.1f} MB)... ", end="", flush=True)
-        
-        start = time.time()
-        code, _ = run_cmd(["cargo", "test", f"test_open_{name}", "--release", "--quiet"], capture=True)
-        elapsed = (time.time() - start) * 1000
-        
-        if code == 0:
-            print(f"{Colors.GREEN}{fmt_time(elapsed)}{Colors.RESET}")
-        else:
-            print(f"{Colors.RED}FAIL{Colors.RESET}")
+        sizes[name] = st.st_size / (1024 * 1024)
+
+    if sizes:
+        filters = [f"test_open_{name}" for name in sizes]
+        start = time.perf_counter()
+        # Ask libtest to report per-test times; if the binary rejects the
+        # flag (it needs unstable options on some toolchains) rerun plain
+        # and fall back to the batch wall-clock below.
+        code, output = run_cmd(
+            [test_bin, "--exact", *filters, "-Zunstable-options", "--report-time"],
+            capture=True,
+        )
+        if "test result:" not in output:
+            code, output = run_cmd([test_bin, "--exact", *filters], capture=True)
+        elapsed = (time.perf_counter() - start) * 1000
+
+        # Per-test status (and time, when reported) comes straight from
+        # libtest's "test <name> ... ok <1.234s>" lines.
+        times = dict(TEST_TIME_RE.findall(output))
+        for name, size_mb in sizes.items():
+            status = f"{Colors.RED}FAIL{Colors.RESET}"
+            if f"test test_open_{name} ... ok" in output:
+                status = f"{Colors.GREEN}ok{Colors.RESET}"
+                secs = times.get(f"test_open_{name}")
+                if secs:
+                    status += f" {Colors.CYAN}{fmt_time(float(secs) * 1000)}{Colors.RESET}"
+            print(f"  {name} ({size_mb:.1f} MB)... {status}")
+        print(f"  {Colors.CYAN}Batch time: {fmt_time(elapsed)}{Colors.RESET}")
     
     print_subheader("Full geometry scan (BMW)")
-    start = time.time()
-    code, output = run_cmd(["cargo", "test", "test_bmw_geometry", "--release", "--", "--nocapture"], capture=True)
-    elapsed = (time.time() - start) * 1000
-    
-    # Print summary lines
-    for line in output.split("\n"):
-        if "Total" in line or "vertices" in line or "faces" in line:
-            print(f"  {line.strip()}")
-    
+    start = time.perf_counter()
+    # Stream and filter summary lines as they arrive.
+    code = run_cmd_filtered(
+        [test_bin, "test_bmw_geometry", "--exact", "--nocapture"],
+        pattern=BENCH_KEYWORDS_RE,
+    )
+    elapsed = (time.perf_counter() - start) * 1000
+
+    if code != 0:
+        print(f"  {Colors.RED}Scan failed{Colors.RESET}")
+        print()
+        return 1
+
     print(f"  {Colors.CYAN}Scan time: {fmt_time(elapsed)}{Colors.RESET}")
     print()
-    
+
     return 0
 
 
+def rmtree_parallel(path: Path, max_workers: int = 16) -> None:
+    """Remove a directory tree, unlinking files from a thread pool.
+
+    Each unlink blocks on filesystem latency, so overlapping them scales
+    deletion throughput; directories are removed bottom-up afterwards.
+    Any failure (permissions, concurrent writers) falls back to
+    shutil.rmtree so the tree is still removed.
+    """
+    import shutil
+    from concurrent.futures import ThreadPoolExecutor
+
+    dirs = []
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = []
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirs.append(dirpath)
+                # os.walk does not descend into symlinked directories, so
+                # unlink the links themselves like files.
+                for name in dirnames:
+                    full = os.path.join(dirpath, name)
+                    if os.path.islink(full):
+                        futures.append(pool.submit(os.unlink, full))
+                for name in filenames:
+                    futures.append(pool.submit(os.unlink, os.path.join(dirpath, name)))
+            # Surface the first unlink error instead of discarding it and
+            # failing later with a misleading ENOTEMPTY from rmdir.
+            for future in futures:
+                future.result()
+
+        for dirpath in reversed(dirs):
+            os.rmdir(dirpath)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+
+
 def cmd_clean() -> int:
     """Clean build artifacts."""
     print_header("CLEAN")
-    
-    run_cmd(["cargo", "clean"])
-    
+
+    # cargo clean and our own tree removal are independent; overlap them.
+    proc = spawn_cmd(["cargo", "clean"], env=cargo_env())
+
     test_out = ROOT_DIR / "test" / "out"
     if test_out.exists():
-        shutil.rmtree(test_out)
+        rmtree_parallel(test_out)
         print(f"  {Colors.YELLOW}Removed test/out{Colors.RESET}")
+
+    proc.wait()
     
     print(f"  {Colors.GREEN}Done!{Colors.RESET}")
     print()
@@ -256,12 +472,19 @@ def show_help() -> None:
 
  OPTIONS
    -v, --verbose  Show detailed output
+   -j, --jobs     Max parallel cargo jobs for test (default: 2)
+   --offline      Pass --offline to cargo (auto-enabled if vendor/ exists)
 
  EXAMPLES
    python bootstrap.py test           # Run all tests
    python bootstrap.py build          # Build release
    python bootstrap.py bench          # Benchmark reading
    python bootstrap.py check          # Check + clippy
+
+ NOTES
+   Each command keeps its own cargo cache under target/ so switching
+   commands never invalidates another command's artifacts. This trades
+   disk space for rebuild time; `clean` removes all of them.
 """)
 
 
@@ -279,6 +502,8 @@ def main() -> int:
     parser.add_argument("command", nargs="?", default="help",
                         choices=["test", "build", "check", "bench", "clean", "help"])
     parser.add_argument("-v", "--verbose", action="store_true")
+    parser.add_argument("-j", "--jobs", type=int, default=2)
+    parser.add_argument("--offline", action="store_true")
     parser.add_argument("-h", "--help", action="store_true")
     
     args = parser.parse_args()
@@ -288,13 +513,21 @@ def main() -> int:
         return 0
     
     os.chdir(ROOT_DIR)
-    
+
+    global OFFLINE
+    OFFLINE = args.offline or (ROOT_DIR / "vendor").exists()
+
+    # Give each subcommand its own cargo cache (see TARGET_DIRS); the
+    # per-job dirs set in cmd_test/cmd_check still override this.
+    if args.command in TARGET_DIRS:
+        os.environ["CARGO_TARGET_DIR"] = str(ROOT_DIR / TARGET_DIRS[args.command])
+
     if args.command == "test":
-        return cmd_test(args.verbose)
+        return cmd_test(args.verbose, args.jobs)
     elif args.command == "build":
-        return cmd_build()
+        return cmd_build(args.verbose)
     elif args.command == "check":
-        return cmd_check()
+        return cmd_check(args.jobs)
     elif args.command == "bench":
         return cmd_bench()
     elif args.command == "clean":
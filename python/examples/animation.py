@@ -9,6 +9,8 @@ This example demonstrates how to:
 """
 
 import math
+from array import array
+
 import alembic_rs
 from alembic_rs import IArchive, OArchive
 
@@ -26,34 +28,36 @@ def write_animated_transform(output_path: str, fps: float = 24.0, num_frames: in
     # Create spinning transform
     xform = alembic_rs.Abc.OXform("spinner")
     
-    # Add rotation samples for 2 seconds (48 frames at 24fps)
+    # Build all Y-axis rotation matrices for 2 seconds (48 frames at
+    # 24fps) up front, then submit them in one bulk call.
+    matrices = []
     for frame in range(num_frames):
         angle = (frame / num_frames) * 2 * math.pi  # Full rotation
-        
-        # Create rotation matrix around Y axis
+
         cos_a = math.cos(angle)
         sin_a = math.sin(angle)
-        
-        matrix = [
+
+        matrices.append([
             [cos_a, 0.0, sin_a, 0.0],
             [0.0, 1.0, 0.0, 0.0],
             [-sin_a, 0.0, cos_a, 0.0],
             [0.0, 0.0, 0.0, 1.0],
-        ]
-        
-        xform.addMatrixSample(matrix, inherits=True)
+        ])
+
+    xform.addMatrixSamples(matrices, inherits=True)
     
-    # Add a cube under the transform
+    # Add a cube under the transform (typed flat arrays cross the FFI
+    # boundary as single buffers)
     mesh = alembic_rs.Abc.OPolyMesh("cube")
-    positions = [
-        [-0.5, -0.5, -0.5], [0.5, -0.5, -0.5], [0.5, 0.5, -0.5], [-0.5, 0.5, -0.5],
-        [-0.5, -0.5,  0.5], [0.5, -0.5,  0.5], [0.5, 0.5,  0.5], [-0.5, 0.5,  0.5],
-    ]
-    face_counts = [4, 4, 4, 4, 4, 4]
-    face_indices = [
+    positions = array("f", [
+        -0.5, -0.5, -0.5,  0.5, -0.5, -0.5,  0.5, 0.5, -0.5,  -0.5, 0.5, -0.5,
+        -0.5, -0.5,  0.5,  0.5, -0.5,  0.5,  0.5, 0.5,  0.5,  -0.5, 0.5,  0.5,
+    ])
+    face_counts = array("i", [4, 4, 4, 4, 4, 4])
+    face_indices = array("i", [
         0, 3, 2, 1, 4, 5, 6, 7, 0, 1, 5, 4,
         2, 3, 7, 6, 0, 4, 7, 3, 1, 2, 6, 5,
-    ]
+    ])
     mesh.addSample(positions, face_counts, face_indices)
     
     xform.addPolyMesh(mesh)
@@ -76,31 +80,36 @@ def write_animated_mesh(output_path: str, fps: float = 24.0, num_frames: int = 2
     # Create deforming sphere
     mesh = alembic_rs.Abc.OPolyMesh("ball")
     
-    # Generate sphere topology (simplified)
-    def make_sphere(radius: float, squash: float = 1.0, y_offset: float = 0.0):
-        """Create a simple UV sphere."""
-        positions = []
-        segments = 8
-        rings = 6
-        
+    segments = 8
+    rings = 6
+
+    # Unit-sphere trig tables, computed once and reused for every frame
+    # (only radius/squash/offset change per frame, not the angles).
+    sin_phi = [math.sin(math.pi * ring / rings) for ring in range(rings + 1)]
+    cos_phi = [math.cos(math.pi * ring / rings) for ring in range(rings + 1)]
+    sin_theta = [math.sin(2 * math.pi * seg / segments) for seg in range(segments)]
+    cos_theta = [math.cos(2 * math.pi * seg / segments) for seg in range(segments)]
+
+    # One positions buffer, allocated once and overwritten in place each
+    # frame instead of building a fresh array per frame.
+    num_verts = (rings + 1) * segments
+    positions = array("f", bytes(4 * 3 * num_verts))
+
+    def fill_sphere(radius: float, squash: float = 1.0, y_offset: float = 0.0):
+        """Fill the shared positions buffer with a simple UV sphere."""
+        i = 0
         for ring in range(rings + 1):
-            phi = math.pi * ring / rings
+            ring_radius = radius * sin_phi[ring]
+            y = radius * cos_phi[ring] * squash + y_offset
             for seg in range(segments):
-                theta = 2 * math.pi * seg / segments
-                
-                x = radius * math.sin(phi) * math.cos(theta)
-                y = radius * math.cos(phi) * squash + y_offset
-                z = radius * math.sin(phi) * math.sin(theta)
-                
-                positions.append([x, y, z])
-        
-        return positions
-    
+                positions[i] = ring_radius * cos_theta[seg]
+                positions[i + 1] = y
+                positions[i + 2] = ring_radius * sin_theta[seg]
+                i += 3
+
     # Topology (shared across all frames)
-    segments = 8
-    rings = 6
-    face_counts = []
-    face_indices = []
+    face_counts = array("i")
+    face_indices = array("i")
     
     for ring in range(rings):
         for seg in range(segments):
@@ -112,19 +121,22 @@ def write_animated_mesh(output_path: str, fps: float = 24.0, num_frames: int = 2
             i3 = (ring + 1) * segments + seg
             
             face_counts.append(4)
-            face_indices.extend([i0, i1, i2, i3])
+            face_indices.extend((i0, i1, i2, i3))
     
+    # Topology is constant, so pass it once; frames only submit positions.
+    mesh.setTopology(face_counts, face_indices)
+
     # Animate bouncing ball
     for frame in range(num_frames):
         t = frame / num_frames
-        
+
         # Bounce animation
         bounce = abs(math.sin(t * 2 * math.pi))
         y_pos = bounce * 2.0  # Height
         squash = 1.0 - 0.3 * (1.0 - bounce)  # Squash at ground
-        
-        positions = make_sphere(0.5, squash, y_pos + 0.5)
-        mesh.addSample(positions, face_counts, face_indices)
+
+        fill_sphere(0.5, squash, y_pos + 0.5)
+        mesh.addPositionsSample(positions)
     
     archive.writePolyMesh(mesh)
     archive.close()
@@ -152,35 +164,39 @@ def read_animated_data(path: str) -> None:
 
 
 def find_animated_objects(obj, path: str = "") -> None:
-    """Find and report animated objects."""
-    current_path = f"{path}/{obj.getName()}"
-    
-    num_samples = obj.getNumSamples()
-    if num_samples > 1:
-        print(f"\n{current_path}: {num_samples} samples")
-        
-        if obj.isXform():
-            # Print first and last xform
-            sample0 = obj.getXformSample(0)
-            sample_last = obj.getXformSample(num_samples - 1)
-            
-            t0 = sample0.getTranslation()
-            t1 = sample_last.getTranslation()
-            
-            print(f"  Frame 0 translation: [{t0[0]:.2f}, {t0[1]:.2f}, {t0[2]:.2f}]")
-            print(f"  Frame {num_samples-1} translation: [{t1[0]:.2f}, {t1[1]:.2f}, {t1[2]:.2f}]")
-        
-        elif obj.isPolyMesh():
-            sample0 = obj.getPolyMeshSample(0)
-            sample_last = obj.getPolyMeshSample(num_samples - 1)
-            
-            print(f"  Vertices: {len(sample0.positions)}")
-            print(f"  First vertex frame 0: {sample0.positions[0]}")
-            print(f"  First vertex frame {num_samples-1}: {sample_last.positions[0]}")
-    
-    # Recurse
-    for i in range(obj.getNumChildren()):
-        find_animated_objects(obj.getChild(i), current_path)
+    """Find and report animated objects (iterative, safe for deep trees)."""
+    stack = [(obj, path)]
+    while stack:
+        obj, parent_path = stack.pop()
+        current_path = f"{parent_path}/{obj.getName()}"
+
+        num_samples = obj.getNumSamples()
+        if num_samples > 1:
+            print(f"\n{current_path}: {num_samples} samples")
+
+            if obj.isXform():
+                # Print first and last xform
+                sample0 = obj.getXformSample(0)
+                sample_last = obj.getXformSample(num_samples - 1)
+
+                t0 = sample0.getTranslation()
+                t1 = sample_last.getTranslation()
+
+                print(f"  Frame 0 translation: [{t0[0]:.2f}, {t0[1]:.2f}, {t0[2]:.2f}]")
+                print(f"  Frame {num_samples-1} translation: [{t1[0]:.2f}, {t1[1]:.2f}, {t1[2]:.2f}]")
+
+            elif obj.isPolyMesh():
+                sample0 = obj.getPolyMeshSample(0)
+                sample_last = obj.getPolyMeshSample(num_samples - 1)
+
+                print(f"  Vertices: {len(sample0.positions)}")
+                print(f"  First vertex frame 0: {sample0.positions[0]}")
+                print(f"  First vertex frame {num_samples-1}: {sample_last.positions[0]}")
+
+        # Fetch children in one FFI call; reversed so they pop in
+        # document order.
+        for child in reversed(obj.getChildren()):
+            stack.append((child, current_path))
 
 
 if __name__ == "__main__":
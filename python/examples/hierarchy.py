@@ -7,24 +7,54 @@ This example demonstrates how to:
 - Navigate hierarchies during reading
 """
 
-import alembic_rs
-from alembic_rs import IArchive, OArchive
+from array import array
+
+from alembic_rs import Abc, IArchive, OArchive
+
+# Bound once at import: constructors resolve to local names instead of
+# re-walking the alembic_rs.Abc attribute chain at every call site.
+# (from alembic_rs.Abc import ... doesn't work for extension submodules.)
+OObject = Abc.OObject
+OXform = Abc.OXform
+OPolyMesh = Abc.OPolyMesh
+
+# Unit cube (edge length 2) as a flat float buffer, built once at import;
+# create_cube_positions only scales it.
+_UNIT_CUBE = array("f", [
+    -1, -1, -1,  1, -1, -1,  1, 1, -1,  -1, 1, -1,
+    -1, -1,  1,  1, -1,  1,  1, 1,  1,  -1, 1,  1,
+])
 
 
 def create_cube_positions(size: float = 1.0):
-    """Generate cube vertex positions."""
+    """Generate cube vertex positions as a flat float buffer."""
     s = size / 2
-    return [
-        [-s, -s, -s], [s, -s, -s], [s, s, -s], [-s, s, -s],
-        [-s, -s,  s], [s, -s,  s], [s, s,  s], [-s, s,  s],
-    ]
+    return array("f", (v * s for v in _UNIT_CUBE))
+
+
+def box_positions(sx: float, sy: float, sz: float,
+                  ox: float = 0.0, oy: float = 0.0, oz: float = 0.0):
+    """Generate box vertex positions with per-axis size and offset.
+
+    Scales/offsets the cached unit cube into one flat float buffer, so
+    procedural parts don't hand-build lists of lists per prim.
+    """
+    hx, hy, hz = sx / 2, sy / 2, sz / 2
+    out = array("f", _UNIT_CUBE)
+    for i in range(0, len(out), 3):
+        out[i] = out[i] * hx + ox
+        out[i + 1] = out[i + 1] * hy + oy
+        out[i + 2] = out[i + 2] * hz + oz
+    return out
 
 
-CUBE_FACE_COUNTS = [4, 4, 4, 4, 4, 4]
-CUBE_FACE_INDICES = [
+# Typed int buffers cross the FFI boundary in one pass instead of
+# boxing each index through PyLong extraction.
+CUBE_FACE_COUNTS = array("i", [4, 4, 4, 4, 4, 4])
+CUBE_FACE_INDICES = array("i", [
     0, 3, 2, 1, 4, 5, 6, 7, 0, 1, 5, 4,
     2, 3, 7, 6, 0, 4, 7, 3, 1, 2, 6, 5,
-]
+])
 
 
 def write_solar_system(output_path: str) -> None:
@@ -35,30 +65,30 @@ def write_solar_system(output_path: str) -> None:
     archive.setDescription("Solar system hierarchy demo")
     
     # Root object
-    root = alembic_rs.Abc.OObject("solar_system")
+    root = OObject("solar_system")
     
     # Sun at center
-    sun_xform = alembic_rs.Abc.OXform("sun_xform")
+    sun_xform = OXform("sun_xform")
     sun_xform.addIdentitySample()
     
-    sun_mesh = alembic_rs.Abc.OPolyMesh("sun")
+    sun_mesh = OPolyMesh("sun")
     sun_mesh.addSample(create_cube_positions(2.0), CUBE_FACE_COUNTS, CUBE_FACE_INDICES)
     sun_xform.addPolyMesh(sun_mesh)
     root.addXform(sun_xform)
     
     # Earth orbiting sun
-    earth_orbit = alembic_rs.Abc.OXform("earth_orbit")
+    earth_orbit = OXform("earth_orbit")
     earth_orbit.addTranslationSample(5.0, 0.0, 0.0)  # 5 units from sun
     
-    earth_mesh = alembic_rs.Abc.OPolyMesh("earth")
+    earth_mesh = OPolyMesh("earth")
     earth_mesh.addSample(create_cube_positions(0.5), CUBE_FACE_COUNTS, CUBE_FACE_INDICES)
     earth_orbit.addPolyMesh(earth_mesh)
     
     # Moon orbiting earth (nested transform)
-    moon_orbit = alembic_rs.Abc.OXform("moon_orbit")
+    moon_orbit = OXform("moon_orbit")
     moon_orbit.addTranslationSample(1.0, 0.0, 0.0)  # 1 unit from earth
     
-    moon_mesh = alembic_rs.Abc.OPolyMesh("moon")
+    moon_mesh = OPolyMesh("moon")
     moon_mesh.addSample(create_cube_positions(0.15), CUBE_FACE_COUNTS, CUBE_FACE_INDICES)
     moon_orbit.addPolyMesh(moon_mesh)
     
@@ -66,10 +96,10 @@ def write_solar_system(output_path: str) -> None:
     root.addXform(earth_orbit)
     
     # Mars
-    mars_orbit = alembic_rs.Abc.OXform("mars_orbit")
+    mars_orbit = OXform("mars_orbit")
     mars_orbit.addTranslationSample(8.0, 0.0, 0.0)
     
-    mars_mesh = alembic_rs.Abc.OPolyMesh("mars")
+    mars_mesh = OPolyMesh("mars")
     mars_mesh.addSample(create_cube_positions(0.3), CUBE_FACE_COUNTS, CUBE_FACE_INDICES)
     mars_orbit.addPolyMesh(mars_mesh)
     root.addXform(mars_orbit)
@@ -86,45 +116,39 @@ def write_robot_arm(output_path: str) -> None:
     archive = OArchive.create(output_path)
     archive.setAppName("alembic_rs Hierarchy Example")
     
-    root = alembic_rs.Abc.OObject("robot")
+    root = OObject("robot")
     
     # Base
-    base = alembic_rs.Abc.OXform("base")
+    base = OXform("base")
     base.addIdentitySample()
     
-    base_mesh = alembic_rs.Abc.OPolyMesh("base_geo")
+    base_mesh = OPolyMesh("base_geo")
     base_mesh.addSample(create_cube_positions(1.0), CUBE_FACE_COUNTS, CUBE_FACE_INDICES)
     base.addPolyMesh(base_mesh)
     
     # Upper arm (child of base)
-    upper_arm = alembic_rs.Abc.OXform("upper_arm")
+    upper_arm = OXform("upper_arm")
     upper_arm.addTranslationSample(0.0, 1.0, 0.0)
     
-    upper_arm_mesh = alembic_rs.Abc.OPolyMesh("upper_arm_geo")
-    positions = [
-        [-0.15, 0.0, -0.15], [0.15, 0.0, -0.15], [0.15, 2.0, -0.15], [-0.15, 2.0, -0.15],
-        [-0.15, 0.0,  0.15], [0.15, 0.0,  0.15], [0.15, 2.0,  0.15], [-0.15, 2.0,  0.15],
-    ]
+    upper_arm_mesh = OPolyMesh("upper_arm_geo")
+    positions = box_positions(0.3, 2.0, 0.3, oy=1.0)
     upper_arm_mesh.addSample(positions, CUBE_FACE_COUNTS, CUBE_FACE_INDICES)
     upper_arm.addPolyMesh(upper_arm_mesh)
     
     # Lower arm (child of upper arm)
-    lower_arm = alembic_rs.Abc.OXform("lower_arm")
+    lower_arm = OXform("lower_arm")
     lower_arm.addTranslationSample(0.0, 2.0, 0.0)
     
-    lower_arm_mesh = alembic_rs.Abc.OPolyMesh("lower_arm_geo")
-    positions = [
-        [-0.1, 0.0, -0.1], [0.1, 0.0, -0.1], [0.1, 1.5, -0.1], [-0.1, 1.5, -0.1],
-        [-0.1, 0.0,  0.1], [0.1, 0.0,  0.1], [0.1, 1.5,  0.1], [-0.1, 1.5,  0.1],
-    ]
+    lower_arm_mesh = OPolyMesh("lower_arm_geo")
+    positions = box_positions(0.2, 1.5, 0.2, oy=0.75)
     lower_arm_mesh.addSample(positions, CUBE_FACE_COUNTS, CUBE_FACE_INDICES)
     lower_arm.addPolyMesh(lower_arm_mesh)
     
     # Gripper (child of lower arm)
-    gripper = alembic_rs.Abc.OXform("gripper")
+    gripper = OXform("gripper")
     gripper.addTranslationSample(0.0, 1.5, 0.0)
     
-    gripper_mesh = alembic_rs.Abc.OPolyMesh("gripper_geo")
+    gripper_mesh = OPolyMesh("gripper_geo")
     gripper_mesh.addSample(create_cube_positions(0.2), CUBE_FACE_COUNTS, CUBE_FACE_INDICES)
     gripper.addPolyMesh(gripper_mesh)
     
@@ -142,41 +166,16 @@ def write_robot_arm(output_path: str) -> None:
 
 def print_hierarchy_tree(path: str) -> None:
     """Read and print full hierarchy tree."""
-    
+
     archive = IArchive(path)
     top = archive.getTop()
-    
+
     print(f"\n{archive.getName()}")
     print("=" * 50)
-    
-    def print_node(obj, indent=0):
-        prefix = "  " * indent
-        icon = get_icon(obj)
-        print(f"{prefix}{icon} {obj.getName()}")
-        
-        # Print world transform if xform
-        if obj.isXform():
-            try:
-                sample = obj.getXformSample(0)
-                t = sample.getTranslation()
-                print(f"{prefix}   pos: ({t[0]:.1f}, {t[1]:.1f}, {t[2]:.1f})")
-            except:
-                pass
-        
-        for i in range(obj.getNumChildren()):
-            print_node(obj.getChild(i), indent + 1)
-    
-    def get_icon(obj):
-        if obj.isXform():
-            return "[X]"
-        elif obj.isPolyMesh():
-            return "[M]"
-        elif obj.isCamera():
-            return "[C]"
-        else:
-            return "[O]"
-    
-    print_node(top)
+
+    # The whole tree is rendered Rust-side in one call: one FFI crossing
+    # and one print instead of several round-trips per node.
+    print(top.formatTree(), end="")
 
 
 if __name__ == "__main__":
@@ -6,6 +6,8 @@ import pytest
 import tempfile
 from pathlib import Path
 
+import alembic_rs
+
 
 @pytest.fixture(scope="session")
 def test_data_dir():
@@ -13,6 +15,15 @@ def test_data_dir():
     return Path(__file__).parent.parent / "data"
 
 
+@pytest.fixture(scope="session")
+def bmw_archive(test_data_dir):
+    """Open bmw.abc once per session (skips when the file is absent)."""
+    path = test_data_dir / "bmw.abc"
+    if not path.exists():
+        pytest.skip("bmw.abc not found")
+    return alembic_rs.IArchive(str(path))
+
+
 @pytest.fixture
 def temp_abc_file():
     """Create a temporary .abc file path."""
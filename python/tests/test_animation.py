@@ -1,6 +1,5 @@
 """Tests for animated data and time sampling."""
 
-import pytest
 import alembic_rs as abc
 
 
@@ -9,15 +8,13 @@ class TestTimeSampling:
     
     def test_uniform_time_sampling(self, temp_abc_file):
         """Test uniform (fps-based) time sampling."""
-        archive = abc.OArchive.create(temp_abc_file)
-        
-        ts_idx = archive.addUniformTimeSampling(24.0)  # 24 fps
-        assert ts_idx == 1  # 0 is always identity
-        
-        root = abc.OObject("")
-        archive.writeArchive(root)
-        del archive
-        
+        with abc.OArchive.create(temp_abc_file) as archive:
+            ts_idx = archive.addUniformTimeSampling(24.0)  # 24 fps
+            assert ts_idx == 1  # 0 is always identity
+
+            root = abc.OObject("")
+            archive.writeArchive(root)
+
         # Read back
         reader = abc.IArchive(temp_abc_file)
         ts = reader.getTimeSampling(1)
@@ -26,15 +23,13 @@ class TestTimeSampling:
     
     def test_acyclic_time_sampling(self, temp_abc_file):
         """Test acyclic (irregular) time sampling."""
-        archive = abc.OArchive.create(temp_abc_file)
-        
-        times = [0.0, 0.5, 1.0, 2.0, 5.0]
-        ts_idx = archive.addAcyclicTimeSampling(times)
-        
-        root = abc.OObject("")
-        archive.writeArchive(root)
-        del archive
-        
+        with abc.OArchive.create(temp_abc_file) as archive:
+            times = [0.0, 0.5, 1.0, 2.0, 5.0]
+            ts_idx = archive.addAcyclicTimeSampling(times)
+
+            root = abc.OObject("")
+            archive.writeArchive(root)
+
         # Read back
         reader = abc.IArchive(temp_abc_file)
         ts = reader.getTimeSampling(ts_idx)
@@ -44,16 +39,14 @@ class TestTimeSampling:
     
     def test_cyclic_time_sampling(self, temp_abc_file):
         """Test cyclic time sampling."""
-        archive = abc.OArchive.create(temp_abc_file)
-        
-        time_per_cycle = 1.0
-        times = [0.0, 0.25, 0.5, 0.75]  # 4 samples per second
-        ts_idx = archive.addCyclicTimeSampling(time_per_cycle, times)
-        
-        root = abc.OObject("")
-        archive.writeArchive(root)
-        del archive
-        
+        with abc.OArchive.create(temp_abc_file) as archive:
+            time_per_cycle = 1.0
+            times = [0.0, 0.25, 0.5, 0.75]  # 4 samples per second
+            ts_idx = archive.addCyclicTimeSampling(time_per_cycle, times)
+
+            root = abc.OObject("")
+            archive.writeArchive(root)
+
         # Read back
         reader = abc.IArchive(temp_abc_file)
         ts = reader.getTimeSampling(ts_idx)
@@ -73,19 +66,12 @@ class TestAnimatedGeometry:
         mesh = abc.OPolyMesh("animated_mesh")
         mesh.setTimeSamplingIndex(ts_idx)
         
-        # Frame 0
-        sample0 = abc.OPolyMeshSample()
-        sample0.setPositions([0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.5, 1.0, 0.0])
-        sample0.setFaceCounts([3])
-        sample0.setFaceIndices([0, 1, 2])
-        mesh.addSample(sample0)
-        
-        # Frame 1 - moved
-        sample1 = abc.OPolyMeshSample()
-        sample1.setPositions([0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.5, 2.0, 0.0])
-        sample1.setFaceCounts([3])
-        sample1.setFaceIndices([0, 1, 2])
-        mesh.addSample(sample1)
+        # Both frames in one call; frame 1 has the apex moved up.
+        frames = [
+            [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.5, 1.0, 0.0],
+            [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.5, 2.0, 0.0],
+        ]
+        mesh.addSamples(frames, [3], [0, 1, 2])
         
         root = abc.OObject("")
         root.addChild(mesh.build())
@@ -100,20 +86,12 @@ class TestAnimatedGeometry:
         xform = abc.OXform("animated_xform")
         xform.setTimeSamplingIndex(ts_idx)
         
-        # Frame 0: origin
-        sample0 = abc.OXformSample()
-        sample0.setTranslation(0.0, 0.0, 0.0)
-        xform.addSample(sample0)
-        
-        # Frame 1: moved
-        sample1 = abc.OXformSample()
-        sample1.setTranslation(10.0, 0.0, 0.0)
-        xform.addSample(sample1)
-        
-        # Frame 2: moved more
-        sample2 = abc.OXformSample()
-        sample2.setTranslation(20.0, 0.0, 0.0)
-        xform.addSample(sample2)
+        # Three frames moving along X, submitted in one call.
+        xform.addTranslationSamples([
+            [0.0, 0.0, 0.0],
+            [10.0, 0.0, 0.0],
+            [20.0, 0.0, 0.0],
+        ])
         
         root = abc.OObject("")
         root.addChild(xform.build())
@@ -131,9 +109,8 @@ class TestAnimatedGeometry:
         prop = obj.addScalarProperty("animated_value", "float")
         prop.setTimeSamplingIndex(ts_idx)
         
-        # Write 10 frames
-        for i in range(10):
-            prop.addSampleFloat(float(i) * 0.1)
+        # Write 10 frames in one call.
+        prop.addSamplesFloat([i * 0.1 for i in range(10)])
         
         root.addChild(obj)
         archive.writeArchive(root)
@@ -145,25 +122,22 @@ class TestReadAnimatedData:
     def test_read_animated_mesh(self, temp_abc_file):
         """Test reading animated mesh samples."""
         # Write
-        archive = abc.OArchive.create(temp_abc_file)
-        ts_idx = archive.addUniformTimeSampling(24.0)
-        
-        mesh = abc.OPolyMesh("mesh")
-        mesh.setTimeSamplingIndex(ts_idx)
-        
-        for i in range(5):
-            sample = abc.OPolyMeshSample()
-            y = float(i) * 0.5
-            sample.setPositions([0.0, y, 0.0, 1.0, y, 0.0, 0.5, y + 1.0, 0.0])
-            sample.setFaceCounts([3])
-            sample.setFaceIndices([0, 1, 2])
-            mesh.addSample(sample)
-        
-        root = abc.OObject("")
-        root.addChild(mesh.build())
-        archive.writeArchive(root)
-        del archive
-        
+        with abc.OArchive.create(temp_abc_file) as archive:
+            ts_idx = archive.addUniformTimeSampling(24.0)
+
+            mesh = abc.OPolyMesh("mesh")
+            mesh.setTimeSamplingIndex(ts_idx)
+
+            frames = [
+                [0.0, i * 0.5, 0.0, 1.0, i * 0.5, 0.0, 0.5, i * 0.5 + 1.0, 0.0]
+                for i in range(5)
+            ]
+            mesh.addSamples(frames, [3], [0, 1, 2])
+
+            root = abc.OObject("")
+            root.addChild(mesh.build())
+            archive.writeArchive(root)
+
         # Read
         reader = abc.IArchive(temp_abc_file)
         top = reader.getTop()
@@ -12,44 +12,32 @@ class TestIArchive:
         with pytest.raises(IOError):
             abc.IArchive("/nonexistent/path.abc")
     
-    def test_open_valid_file(self, test_data_dir):
+    def test_open_valid_file(self, bmw_archive):
         """Open a valid archive."""
-        bmw_path = test_data_dir / "bmw.abc"
-        if bmw_path.exists():
-            archive = abc.IArchive(str(bmw_path))
-            assert archive.valid()
-            assert "bmw" in archive.getName()
-    
-    def test_get_top(self, test_data_dir):
+        assert bmw_archive.valid()
+        assert "bmw" in bmw_archive.getName()
+
+    def test_get_top(self, bmw_archive):
         """Get the top (root) object."""
-        bmw_path = test_data_dir / "bmw.abc"
-        if bmw_path.exists():
-            archive = abc.IArchive(str(bmw_path))
-            top = archive.getTop()
-            assert top is not None
-            assert top.getFullName() == "/"
-    
-    def test_time_samplings(self, test_data_dir):
+        top = bmw_archive.getTop()
+        assert top is not None
+        assert top.getFullName() == "/"
+
+    def test_time_samplings(self, bmw_archive):
         """Test time sampling access."""
-        bmw_path = test_data_dir / "bmw.abc"
-        if bmw_path.exists():
-            archive = abc.IArchive(str(bmw_path))
-            num_ts = archive.getNumTimeSamplings()
-            assert num_ts >= 1
-            
-            ts = archive.getTimeSampling(0)
-            assert ts is not None
-    
-    def test_archive_version(self, test_data_dir):
+        num_ts = bmw_archive.getNumTimeSamplings()
+        assert num_ts >= 1
+
+        ts = bmw_archive.getTimeSampling(0)
+        assert ts is not None
+
+    def test_archive_version(self, bmw_archive):
         """Test archive version access."""
-        bmw_path = test_data_dir / "bmw.abc"
-        if bmw_path.exists():
-            archive = abc.IArchive(str(bmw_path))
-            version = archive.getArchiveVersion()
-            assert version > 0
-            
-            version_str = archive.getArchiveVersionString()
-            assert "." in version_str
+        version = bmw_archive.getArchiveVersion()
+        assert version > 0
+
+        version_str = bmw_archive.getArchiveVersionString()
+        assert "." in version_str
 
 
 class TestOArchive:
@@ -66,16 +54,15 @@ class TestOArchive:
     def test_roundtrip_metadata(self, temp_abc_file):
         """Test archive metadata roundtrip."""
         # Write
-        archive = abc.OArchive.create(temp_abc_file)
-        archive.setAppName("Test App v1.0")
-        archive.setDateWritten("2025-01-09")
-        archive.setDescription("Test description")
-        archive.setDccFps(24.0)
-        
-        root = abc.OObject("")
-        archive.writeArchive(root)
-        del archive
-        
+        with abc.OArchive.create(temp_abc_file) as archive:
+            archive.setAppName("Test App v1.0")
+            archive.setDateWritten("2025-01-09")
+            archive.setDescription("Test description")
+            archive.setDccFps(24.0)
+
+            root = abc.OObject("")
+            archive.writeArchive(root)
+
         # Read back
         reader = abc.IArchive(temp_abc_file)
         assert reader.getAppName() == "Test App v1.0"
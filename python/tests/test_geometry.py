@@ -1,6 +1,5 @@
 """Tests for geometry types: PolyMesh, Xform, etc."""
 
-import pytest
 import alembic_rs as abc
 
 
@@ -13,17 +12,9 @@ class TestPolyMesh:
         
         mesh = abc.OPolyMesh("triangle")
         
-        # Triangle vertices
+        # Triangle vertices; counts and sequential indices are built Rust-side.
         positions = [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.5, 1.0, 0.0]
-        face_counts = [3]  # One triangle
-        face_indices = [0, 1, 2]
-        
-        sample = abc.OPolyMeshSample()
-        sample.setPositions(positions)
-        sample.setFaceCounts(face_counts)
-        sample.setFaceIndices(face_indices)
-        
-        mesh.addSample(sample)
+        mesh.addTriangleSample(positions)
         
         root = abc.OObject("")
         root.addChild(mesh.build())
@@ -65,16 +56,11 @@ class TestPolyMesh:
         
         archive.writeArchive(root)
     
-    def test_read_polymesh(self, test_data_dir):
+    def test_read_polymesh(self, bmw_archive):
         """Read a PolyMesh from file."""
-        bmw_path = test_data_dir / "bmw.abc"
-        if not bmw_path.exists():
-            pytest.skip("bmw.abc not found")
-        
-        archive = abc.IArchive(str(bmw_path))
         # BMw typically has meshes at /bmw/Body etc.
         # Just test that we can open and traverse
-        assert archive.valid()
+        assert bmw_archive.valid()
     
     def test_polymesh_with_uvs(self, temp_abc_file):
         """Write a mesh with UV coordinates."""
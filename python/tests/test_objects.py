@@ -1,65 +1,44 @@
 """Tests for IObject and OObject."""
 
-import pytest
 import alembic_rs as abc
 
 
 class TestIObject:
     """Tests for reading objects."""
     
-    def test_root_object(self, test_data_dir):
+    def test_root_object(self, bmw_archive):
         """Test root object properties."""
-        bmw_path = test_data_dir / "bmw.abc"
-        if not bmw_path.exists():
-            pytest.skip("bmw.abc not found")
-        
-        archive = abc.IArchive(str(bmw_path))
-        root = archive.getTop()
-        
+        root = bmw_archive.getTop()
+
         assert root.getName() == "ABC"
         assert root.getFullName() == "/"
         assert root.getNumChildren() > 0
-    
-    def test_child_traversal(self, test_data_dir):
+
+    def test_child_traversal(self, bmw_archive):
         """Test traversing children."""
-        bmw_path = test_data_dir / "bmw.abc"
-        if not bmw_path.exists():
-            pytest.skip("bmw.abc not found")
-        
-        archive = abc.IArchive(str(bmw_path))
-        root = archive.getTop()
-        
+        root = bmw_archive.getTop()
+
         for i in range(root.getNumChildren()):
             child = root.getChild(i)
             assert child is not None
             assert len(child.getName()) > 0
-    
-    def test_child_by_name(self, test_data_dir):
+
+    def test_child_by_name(self, bmw_archive):
         """Test getting child by name."""
-        bmw_path = test_data_dir / "bmw.abc"
-        if not bmw_path.exists():
-            pytest.skip("bmw.abc not found")
-        
-        archive = abc.IArchive(str(bmw_path))
-        root = archive.getTop()
-        
+        root = bmw_archive.getTop()
+
         if root.getNumChildren() > 0:
             first_child = root.getChild(0)
             name = first_child.getName()
-            
+
             same_child = root.getChildByName(name)
             assert same_child is not None
             assert same_child.getName() == name
-    
-    def test_has_child(self, test_data_dir):
+
+    def test_has_child(self, bmw_archive):
         """Test checking if child exists."""
-        bmw_path = test_data_dir / "bmw.abc"
-        if not bmw_path.exists():
-            pytest.skip("bmw.abc not found")
-        
-        archive = abc.IArchive(str(bmw_path))
-        root = archive.getTop()
-        
+        root = bmw_archive.getTop()
+
         if root.getNumChildren() > 0:
             first_child = root.getChild(0)
             assert root.hasChild(first_child.getName())
@@ -77,18 +56,16 @@ class TestOObject:
     
     def test_add_child(self, temp_abc_file):
         """Test adding child objects."""
-        archive = abc.OArchive.create(temp_abc_file)
-        
-        root = abc.OObject("")
-        child1 = abc.OObject("child1")
-        child2 = abc.OObject("child2")
-        
-        root.addChild(child1)
-        root.addChild(child2)
-        
-        archive.writeArchive(root)
-        del archive
-        
+        with abc.OArchive.create(temp_abc_file) as archive:
+            root = abc.OObject("")
+            child1 = abc.OObject("child1")
+            child2 = abc.OObject("child2")
+
+            root.addChild(child1)
+            root.addChild(child2)
+
+            archive.writeArchive(root)
+
         # Read back and verify
         reader = abc.IArchive(temp_abc_file)
         top = reader.getTop()
@@ -98,20 +75,18 @@ class TestOObject:
     
     def test_nested_hierarchy(self, temp_abc_file):
         """Test nested object hierarchy."""
-        archive = abc.OArchive.create(temp_abc_file)
-        
-        root = abc.OObject("")
-        parent = abc.OObject("parent")
-        child = abc.OObject("child")
-        grandchild = abc.OObject("grandchild")
-        
-        child.addChild(grandchild)
-        parent.addChild(child)
-        root.addChild(parent)
-        
-        archive.writeArchive(root)
-        del archive
-        
+        with abc.OArchive.create(temp_abc_file) as archive:
+            root = abc.OObject("")
+            parent = abc.OObject("parent")
+            child = abc.OObject("child")
+            grandchild = abc.OObject("grandchild")
+
+            child.addChild(grandchild)
+            parent.addChild(child)
+            root.addChild(parent)
+
+            archive.writeArchive(root)
+
         # Read back and verify
         reader = abc.IArchive(temp_abc_file)
         top = reader.getTop()
@@ -1,93 +1,63 @@
 """Tests for properties: scalar, array, compound."""
 
+from array import array
+
 import pytest
 import alembic_rs as abc
 
 
+@pytest.fixture
+def writer_obj(temp_abc_file):
+    """Yield an object to add properties to; write the archive on teardown.
+
+    Factors the create/root/addChild/writeArchive boilerplate out of the
+    scalar property tests, which then only build their property.
+    """
+    archive = abc.OArchive.create(temp_abc_file)
+    root = abc.OObject("")
+    obj = abc.OObject("test_obj")
+
+    yield obj
+
+    root.addChild(obj)
+    archive.writeArchive(root)
+
+
 class TestScalarProperties:
     """Tests for scalar properties."""
-    
-    def test_write_int_property(self, temp_abc_file):
+
+    def test_write_int_property(self, writer_obj):
         """Write an integer scalar property."""
-        archive = abc.OArchive.create(temp_abc_file)
-        
-        root = abc.OObject("")
-        obj = abc.OObject("test_obj")
-        
-        prop = obj.addScalarProperty("int_prop", "int")
-        prop.addSampleInt(42)
-        prop.addSampleInt(100)
-        
-        root.addChild(obj)
-        archive.writeArchive(root)
-    
-    def test_write_float_property(self, temp_abc_file):
+        prop = writer_obj.addScalarProperty("int_prop", "int")
+        # Both samples in one call.
+        prop.addSamplesInt([42, 100])
+
+    def test_write_float_property(self, writer_obj):
         """Write a float scalar property."""
-        archive = abc.OArchive.create(temp_abc_file)
-        
-        root = abc.OObject("")
-        obj = abc.OObject("test_obj")
-        
-        prop = obj.addScalarProperty("float_prop", "float")
-        prop.addSampleFloat(3.14)
-        prop.addSampleFloat(2.71)
-        
-        root.addChild(obj)
-        archive.writeArchive(root)
-    
-    def test_write_double_property(self, temp_abc_file):
+        # Dtype tag skips the per-call type-name parse.
+        prop = writer_obj.addScalarProperty("float_prop", abc.Dtype.Float32)
+        prop.addSamplesFloat([3.14, 2.71])
+
+    def test_write_double_property(self, writer_obj):
         """Write a double scalar property."""
-        archive = abc.OArchive.create(temp_abc_file)
-        
-        root = abc.OObject("")
-        obj = abc.OObject("test_obj")
-        
-        prop = obj.addScalarProperty("double_prop", "double")
+        prop = writer_obj.addScalarProperty("double_prop", "double")
         prop.addSampleDouble(3.14159265358979)
-        
-        root.addChild(obj)
-        archive.writeArchive(root)
-    
-    def test_write_bool_property(self, temp_abc_file):
+
+    def test_write_bool_property(self, writer_obj):
         """Write a boolean scalar property."""
-        archive = abc.OArchive.create(temp_abc_file)
-        
-        root = abc.OObject("")
-        obj = abc.OObject("test_obj")
-        
-        prop = obj.addScalarProperty("bool_prop", "bool")
-        prop.addSampleBool(True)
-        prop.addSampleBool(False)
-        
-        root.addChild(obj)
-        archive.writeArchive(root)
-    
-    def test_write_string_property(self, temp_abc_file):
+        prop = writer_obj.addScalarProperty("bool_prop", "bool")
+        prop.addSamplesBool([True, False])
+
+    def test_write_string_property(self, writer_obj):
         """Write a string scalar property."""
-        archive = abc.OArchive.create(temp_abc_file)
-        
-        root = abc.OObject("")
-        obj = abc.OObject("test_obj")
-        
-        prop = obj.addScalarProperty("string_prop", "string")
+        prop = writer_obj.addScalarProperty("string_prop", "string")
         prop.addSampleString("Hello, World!")
         prop.addSampleString("Another string")
-        
-        root.addChild(obj)
-        archive.writeArchive(root)
-    
-    def test_write_vec3f_property(self, temp_abc_file):
+
+    def test_write_vec3f_property(self, writer_obj):
         """Write a vec3f scalar property."""
-        archive = abc.OArchive.create(temp_abc_file)
-        
-        root = abc.OObject("")
-        obj = abc.OObject("test_obj")
-        
-        prop = obj.addScalarProperty("vec3f_prop", "vec3f")
+        prop = writer_obj.addScalarProperty("vec3f_prop", "vec3f")
         prop.addSampleVec3f(1.0, 2.0, 3.0)
-        
-        root.addChild(obj)
-        archive.writeArchive(root)
 
 
 class TestArrayProperties:
@@ -100,9 +70,10 @@ class TestArrayProperties:
         root = abc.OObject("")
         obj = abc.OObject("test_obj")
         
-        prop = obj.addArrayProperty("int_array", "int")
-        prop.addSampleInts([1, 2, 3, 4, 5])
-        prop.addSampleInts([10, 20, 30])
+        prop = obj.addArrayProperty("int_array", abc.Dtype.Int32)
+        # Typed buffers cross the FFI boundary in one pass (lists still work).
+        prop.addSampleInts(array("i", [1, 2, 3, 4, 5]))
+        prop.addSampleInts(array("i", [10, 20, 30]))
         
         root.addChild(obj)
         archive.writeArchive(root)
@@ -115,7 +86,7 @@ class TestArrayProperties:
         obj = abc.OObject("test_obj")
         
         prop = obj.addArrayProperty("float_array", "float")
-        prop.addSampleFloats([1.0, 2.0, 3.0, 4.0])
+        prop.addSampleFloats(array("f", [1.0, 2.0, 3.0, 4.0]))
         
         root.addChild(obj)
         archive.writeArchive(root)
@@ -128,7 +99,7 @@ class TestArrayProperties:
         obj = abc.OObject("test_obj")
         
         prop = obj.addArrayProperty("double_array", "double")
-        prop.addSampleDoubles([1.0, 2.0, 3.0])
+        prop.addSampleDoubles(array("d", [1.0, 2.0, 3.0]))
         
         root.addChild(obj)
         archive.writeArchive(root)
@@ -154,8 +125,8 @@ class TestArrayProperties:
         obj = abc.OObject("test_obj")
         
         prop = obj.addArrayProperty("vec3f_array", "vec3f")
-        # 3 vectors (9 floats total)
-        prop.addSampleVec3fs([0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0])
+        # 3 vectors (9 floats total), as one packed buffer
+        prop.addSampleVec3fs(array("f", [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0]))
         
         root.addChild(obj)
         archive.writeArchive(root)
@@ -4,6 +4,27 @@ import pytest
 import alembic_rs as abc
 
 
+@pytest.fixture(scope="module")
+def visibility_abc(tmp_path_factory):
+    """Archive with a visible/hidden visibility track, written once per module.
+
+    The read tests below share it, so the write+flush cost is paid once
+    instead of once per test.
+    """
+    path = str(tmp_path_factory.mktemp("visibility") / "visibility.abc")
+    with abc.OArchive.create(path) as archive:
+        root = abc.OObject("")
+        obj = abc.OObject("test_vis")
+
+        vis_prop = obj.addVisibilityProperty()
+        vis_prop.setVisible()
+        vis_prop.setHidden()
+
+        root.addChild(obj)
+        archive.writeArchive(root)
+    return path
+
+
 class TestVisibility:
     """Tests for object visibility."""
     
@@ -28,24 +49,9 @@ class TestVisibility:
         root.addChild(obj)
         archive.writeArchive(root)
     
-    def test_read_visibility(self, temp_abc_file):
+    def test_read_visibility(self, visibility_abc):
         """Read visibility property."""
-        # First write
-        archive = abc.OArchive.create(temp_abc_file)
-        
-        root = abc.OObject("")
-        obj = abc.OObject("test_vis")
-        
-        vis_prop = obj.addVisibilityProperty()
-        vis_prop.setVisible()
-        vis_prop.setHidden()
-        
-        root.addChild(obj)
-        archive.writeArchive(root)
-        del archive
-        
-        # Then read
-        reader = abc.IArchive(temp_abc_file)
+        reader = abc.IArchive(visibility_abc)
         top = reader.getTop()
         child = top.getChildByName("test_vis")
         
@@ -58,24 +64,9 @@ class TestVisibility:
         vis = child.getVisibility(1)
         assert vis == abc.ObjectVisibility.hidden()
     
-    def test_is_visible_helper(self, temp_abc_file):
+    def test_is_visible_helper(self, visibility_abc):
         """Test isVisible helper method."""
-        # Write
-        archive = abc.OArchive.create(temp_abc_file)
-        
-        root = abc.OObject("")
-        obj = abc.OObject("test_vis")
-        
-        vis_prop = obj.addVisibilityProperty()
-        vis_prop.setVisible()
-        vis_prop.setHidden()
-        
-        root.addChild(obj)
-        archive.writeArchive(root)
-        del archive
-        
-        # Read
-        reader = abc.IArchive(temp_abc_file)
+        reader = abc.IArchive(visibility_abc)
         top = reader.getTop()
         child = top.getChildByName("test_vis")
         
@@ -4,7 +4,7 @@
 //! abstract Core layer traits.
 
 use std::path::Path;
-use std::sync::Arc;
+use std::sync::{Arc, OnceLock};
 
 use super::{IArchive as OgawaIArchive, IGroup, IData};
 use super::read_util::{
@@ -359,6 +359,13 @@ impl ObjectReader for OgawaObjectReader {
 struct ObjectData {
     group: IGroup,
     children: Vec<ParsedObjectHeader>,
+    /// Child indices sorted by name, for O(log k) lookup by name on
+    /// wide hierarchies (child order on disk is creation order).
+    children_by_name: Vec<u32>,
+    /// Parsed child data, filled on first access. Repeated root-to-leaf
+    /// traversals reuse the parse instead of re-reading headers and
+    /// properties from disk each time.
+    child_data: Vec<OnceLock<Arc<ObjectData>>>,
     properties: CompoundData,
     indexed_metadata: Arc<Vec<MetaData>>,
     cache: Arc<ReadArraySampleCache>,
@@ -389,9 +396,17 @@ impl ObjectData {
             CompoundData::empty()
         };
         
+        let mut children_by_name: Vec<u32> = (0..children.len() as u32).collect();
+        children_by_name
+            .sort_by(|&a, &b| children[a as usize].name.cmp(&children[b as usize].name));
+
+        let child_data = (0..children.len()).map(|_| OnceLock::new()).collect();
+
         Ok(Self {
             group,
             children,
+            children_by_name,
+            child_data,
             properties,
             indexed_metadata,
             cache,
@@ -413,27 +428,35 @@ impl ObjectData {
             return None;
         }
         
-        let header = &self.children[index];
-        // Child objects start at group index 1 (index 0 is properties compound)
-        let group_index = (index + 1) as u64;
-        
-        Some(self.create_child_reader(group_index, header))
+        Some(self.create_child_reader(index))
     }
     
     fn child_by_name(&self, name: &str) -> Option<Result<OgawaObjectReader>> {
-        let index = self.children.iter().position(|h| h.name == name)?;
-        self.child(index)
+        let slot = self
+            .children_by_name
+            .binary_search_by(|&i| self.children[i as usize].name.as_str().cmp(name))
+            .ok()?;
+        self.child(self.children_by_name[slot] as usize)
     }
     
-    fn create_child_reader(&self, group_index: u64, header: &ParsedObjectHeader) -> Result<OgawaObjectReader> {
-        let child_group = self.group.group(group_index)?;
-        let child_data = Arc::new(ObjectData::new(
-            child_group,
-            &header.full_name,
-            self.indexed_metadata.clone(),
-            self.cache.clone(),
-        )?);
-        
+    fn create_child_reader(&self, index: usize) -> Result<OgawaObjectReader> {
+        let header = &self.children[index];
+        let child_data = if let Some(data) = self.child_data[index].get() {
+            data.clone()
+        } else {
+            // Child objects start at group index 1 (index 0 is properties compound)
+            let child_group = self.group.group((index + 1) as u64)?;
+            let data = Arc::new(ObjectData::new(
+                child_group,
+                &header.full_name,
+                self.indexed_metadata.clone(),
+                self.cache.clone(),
+            )?);
+            // A concurrent traversal may have won the race; either copy is fine.
+            let _ = self.child_data[index].set(data.clone());
+            data
+        };
+
         let obj_header = ObjectHeader {
             name: header.name.clone(),
             full_name: header.full_name.clone(),
@@ -65,6 +65,44 @@ impl OArchive {
         Ok(pos)
     }
 
+    /// Write pre-encoded data with an already-computed content key.
+    ///
+    /// Same layout and dedup behavior as `write_keyed_data`, but takes
+    /// the encoded bytes and key from a precompute pass (see the
+    /// parallel encode in `collect_property_sample_data`) instead of
+    /// redoing the encode + digest here.
+    pub fn write_keyed_data_precomputed(
+        &mut self,
+        encoded: &[u8],
+        content_key: &ArraySampleContentKey,
+    ) -> Result<u64> {
+        if self.frozen {
+            return Err(Error::Frozen);
+        }
+
+        if encoded.is_empty() {
+            return Ok(0);
+        }
+
+        if self.dedup_enabled {
+            if let Some(&existing_pos) = self.dedup_map.get(content_key) {
+                return Ok(existing_pos);
+            }
+        }
+
+        let pos = self.stream.pos();
+        let total_size = DATA_KEY_SIZE + encoded.len();
+        self.stream.write_u64(total_size as u64)?;
+        self.stream.write_bytes(content_key.digest())?;
+        self.stream.write_bytes(encoded)?;
+
+        if self.dedup_enabled {
+            self.dedup_map.insert(*content_key, pos);
+        }
+
+        Ok(pos)
+    }
+
     /// Write data with specific key (for known digest).
     ///
     /// Used for raw copy paths where the digest is already known.
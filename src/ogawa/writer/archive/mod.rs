@@ -61,8 +61,15 @@ impl OArchive {
     ///
     /// Mirrors `AwImpl::init()` header setup.
     pub fn create(path: impl AsRef<Path>) -> Result<Self> {
+        Self::create_with_buffer_size(path, super::stream::DEFAULT_WRITE_BUFFER_SIZE)
+    }
+
+    /// Create a new Alembic file for writing with an explicit write-buffer size.
+    ///
+    /// Small archives can shrink the buffer; large bulk writes may grow it.
+    pub fn create_with_buffer_size(path: impl AsRef<Path>, buffer_size: usize) -> Result<Self> {
         let name = path.as_ref().to_string_lossy().to_string();
-        let mut stream = OStream::create(&path)?;
+        let mut stream = OStream::create_with_capacity(&path, buffer_size)?;
 
         // Header with placeholder for root position.
         stream.write_bytes(OGAWA_MAGIC)?;
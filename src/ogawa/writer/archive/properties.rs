@@ -13,8 +13,45 @@ use super::super::write_util::{
 use crate::core::{ArraySampleContentKey, TimeSampling};
 use crate::ogawa::format::{make_data_offset, make_group_offset, EMPTY_DATA};
 use crate::util::{PlainOldDataType, Result};
+use rayon::prelude::*;
 use spooky_hash::SpookyHash;
 
+/// Samples encoded per precompute batch. Bounds the extra memory the
+/// parallel prepass holds to one batch of encoded samples instead of
+/// every sample of a long animated property at once.
+const PRECOMPUTE_BATCH: usize = 256;
+
+/// Encode a batch of samples and compute their content keys on the
+/// Rayon pool.
+///
+/// Encoding and digesting are pure per-sample compute, so sibling
+/// samples run in parallel; the serial write pass below consumes the
+/// results in order, leaving stream offsets and dedup behavior
+/// unchanged. Entries are `None` for samples that carry a pre-computed
+/// digest.
+fn precompute_content_keys(
+    samples: Vec<(&[u8], bool)>,
+    pod: PlainOldDataType,
+) -> Vec<Option<(Vec<u8>, ArraySampleContentKey)>> {
+    let pod_size = pod_seed(pod);
+    let pod_tag = match pod {
+        PlainOldDataType::String | PlainOldDataType::Wstring => pod_to_u8(pod),
+        _ => pod_to_u8(PlainOldDataType::Int8),
+    };
+    samples
+        .into_par_iter()
+        .map(|(data, has_digest)| {
+            if has_digest {
+                None
+            } else {
+                let encoded = encode_sample_for_pod(data, pod);
+                let key = ArraySampleContentKey::from_data(&encoded, None, pod_size, pod_tag);
+                Some((encoded, key))
+            }
+        })
+        .collect()
+}
+
 impl OArchive {
     /// Write properties and return (pos, hash1, hash2, raw_hashes).
     pub(super) fn write_properties_with_data(
@@ -142,62 +179,65 @@ impl OArchive {
                 let mut prev_key: Option<ArraySampleContentKey> = None;
                 let mut prev_data_pos: Option<u64> = None;
 
-                for (index, sample) in samples.iter().enumerate() {
-                    let sample_index = index as u32;
-                    let (digest, content_key) = if let Some(d) = &sample.digest {
-                        let pod_tag = match prop.data_type.pod {
-                            PlainOldDataType::String | PlainOldDataType::Wstring => {
-                                pod_to_u8(prop.data_type.pod)
-                            }
-                            _ => pod_to_u8(PlainOldDataType::Int8),
+                for (batch_idx, batch) in samples.chunks(PRECOMPUTE_BATCH).enumerate() {
+                    let mut precomputed = precompute_content_keys(
+                        batch.iter().map(|s| (s.data.as_slice(), s.digest.is_some())).collect(),
+                        prop.data_type.pod,
+                    );
+
+                    for (offset, sample) in batch.iter().enumerate() {
+                        let sample_index = (batch_idx * PRECOMPUTE_BATCH + offset) as u32;
+                        let (digest, content_key) = if let Some(d) = &sample.digest {
+                            let pod_tag = match prop.data_type.pod {
+                                PlainOldDataType::String | PlainOldDataType::Wstring => {
+                                    pod_to_u8(prop.data_type.pod)
+                                }
+                                _ => pod_to_u8(PlainOldDataType::Int8),
+                            };
+                            (*d, ArraySampleContentKey::from_digest(*d, sample.data.len(), pod_tag))
+                        } else {
+                            let (_, key) = precomputed[offset].as_ref().expect("precomputed key");
+                            (*key.digest(), *key)
                         };
-                        (*d, ArraySampleContentKey::from_digest(*d, sample.data.len(), pod_tag))
-                    } else {
-                        let encoded = encode_sample_for_pod(&sample.data, prop.data_type.pod);
-                        let pod_size = pod_seed(prop.data_type.pod);
-                        let pod_tag = match prop.data_type.pod {
-                            PlainOldDataType::String | PlainOldDataType::Wstring => {
-                                pod_to_u8(prop.data_type.pod)
-                            }
-                            _ => pod_to_u8(PlainOldDataType::Int8),
+
+                        let d0 = u64::from_le_bytes(digest[0..8].try_into().unwrap());
+                        let d1 = u64::from_le_bytes(digest[8..16].try_into().unwrap());
+                        state.sample_hash = match state.sample_hash {
+                            None => Some((d0, d1)),
+                            Some((h0, h1)) => Some(SpookyHash::short_end_mix(h0, h1, d0, d1)),
                         };
-                        let content_key =
-                            ArraySampleContentKey::from_data(&encoded, None, pod_size, pod_tag);
-                        (*content_key.digest(), content_key)
-                    };
-
-                    let d0 = u64::from_le_bytes(digest[0..8].try_into().unwrap());
-                    let d1 = u64::from_le_bytes(digest[8..16].try_into().unwrap());
-                    state.sample_hash = match state.sample_hash {
-                        None => Some((d0, d1)),
-                        Some((h0, h1)) => Some(SpookyHash::short_end_mix(h0, h1, d0, d1)),
-                    };
-
-                    let key_changed = prev_key.as_ref().is_none_or(|k| *k != content_key);
-                    if sample_index == 0 || key_changed {
-                        if sample_index > 0 && state.first_changed_index != 0 {
-                            for _ in (state.last_changed_index + 1)..sample_index {
-                                if let Some(pos) = prev_data_pos {
-                                    state.children.push(make_data_offset(pos));
+
+                        let key_changed = prev_key.as_ref().is_none_or(|k| *k != content_key);
+                        if sample_index == 0 || key_changed {
+                            if sample_index > 0 && state.first_changed_index != 0 {
+                                for _ in (state.last_changed_index + 1)..sample_index {
+                                    if let Some(pos) = prev_data_pos {
+                                        state.children.push(make_data_offset(pos));
+                                    }
                                 }
                             }
-                        }
 
-                        let pos = if sample.digest.is_some() {
-                            self.write_keyed_data_with_key(&sample.data, &digest, prop.data_type.pod)?
-                        } else {
-                            self.write_keyed_data(&sample.data, prop.data_type.pod)?
-                        };
-                        prev_data_pos = Some(pos);
-                        prev_key = Some(content_key);
-                        state.children.push(make_data_offset(pos));
-
-                        if sample_index != 0 {
-                            if state.first_changed_index == 0 {
-                                state.first_changed_index = sample_index;
+                            let pos = if sample.digest.is_some() {
+                                self.write_keyed_data_with_key(&sample.data, &digest, prop.data_type.pod)?
+                            } else {
+                                let (encoded, key) = precomputed[offset].as_ref().expect("precomputed key");
+                                self.write_keyed_data_precomputed(encoded, key)?
+                            };
+                            prev_data_pos = Some(pos);
+                            prev_key = Some(content_key);
+                            state.children.push(make_data_offset(pos));
+
+                            if sample_index != 0 {
+                                if state.first_changed_index == 0 {
+                                    state.first_changed_index = sample_index;
+                                }
+                                state.last_changed_index = sample_index;
                             }
-                            state.last_changed_index = sample_index;
                         }
+
+                        // Free the encoded bytes as soon as the sample is
+                        // consumed.
+                        precomputed[offset] = None;
                     }
                 }
 
@@ -223,103 +263,106 @@ impl OArchive {
                 let mut prev_num_points: Option<usize> = None;
                 let mut prev_dims: Option<Vec<usize>> = None;
 
-                for (index, sample) in samples.iter().enumerate() {
-                    let sample_index = index as u32;
-                    let (digest, content_key) = if let Some(d) = &sample.digest {
-                        let pod_tag = match prop.data_type.pod {
-                            PlainOldDataType::String | PlainOldDataType::Wstring => {
-                                pod_to_u8(prop.data_type.pod)
-                            }
-                            _ => pod_to_u8(PlainOldDataType::Int8),
-                        };
-                        (*d, ArraySampleContentKey::from_digest(*d, sample.data.len(), pod_tag))
-                    } else {
-                        let encoded = encode_sample_for_pod(&sample.data, prop.data_type.pod);
-                        let pod_size = pod_seed(prop.data_type.pod);
-                        let pod_tag = match prop.data_type.pod {
-                            PlainOldDataType::String | PlainOldDataType::Wstring => {
-                                pod_to_u8(prop.data_type.pod)
-                            }
-                            _ => pod_to_u8(PlainOldDataType::Int8),
-                        };
-                        let content_key =
-                            ArraySampleContentKey::from_data(&encoded, None, pod_size, pod_tag);
-                        (*content_key.digest(), content_key)
-                    };
-
-                    let key_changed = prev_key.as_ref().is_none_or(|k| *k != content_key);
-                    let dims_for_hash = if key_changed {
-                        &sample.dims
-                    } else {
-                        prev_dims.as_ref().unwrap_or(&sample.dims)
-                    };
-
-                    let mut d = (
-                        u64::from_le_bytes(digest[0..8].try_into().unwrap()),
-                        u64::from_le_bytes(digest[8..16].try_into().unwrap()),
+                for (batch_idx, batch) in samples.chunks(PRECOMPUTE_BATCH).enumerate() {
+                    let mut precomputed = precompute_content_keys(
+                        batch.iter().map(|s| (s.data.as_slice(), s.digest.is_some())).collect(),
+                        prop.data_type.pod,
                     );
-                    hash_dimensions(dims_for_hash, &mut d);
-                    state.sample_hash = match state.sample_hash {
-                        None => Some(d),
-                        Some((h0, h1)) => Some(SpookyHash::short_end_mix(h0, h1, d.0, d.1)),
-                    };
-
-                    if sample_index == 0 || key_changed {
-                        if sample_index > 0 && state.first_changed_index != 0 {
-                            for _ in (state.last_changed_index + 1)..sample_index {
-                                if let (Some(pos), Some(dim_pos)) = (prev_data_pos, prev_dims_pos) {
-                                    state.children.push(make_data_offset(pos));
-                                    state.children.push(dim_pos);
-                                }
-                            }
-                        }
 
-                        let data_pos = if sample.digest.is_some() {
-                            self.write_keyed_data_with_key(&sample.data, &digest, prop.data_type.pod)?
+                    for (offset, sample) in batch.iter().enumerate() {
+                        let sample_index = (batch_idx * PRECOMPUTE_BATCH + offset) as u32;
+                        let (digest, content_key) = if let Some(d) = &sample.digest {
+                            let pod_tag = match prop.data_type.pod {
+                                PlainOldDataType::String | PlainOldDataType::Wstring => {
+                                    pod_to_u8(prop.data_type.pod)
+                                }
+                                _ => pod_to_u8(PlainOldDataType::Int8),
+                            };
+                            (*d, ArraySampleContentKey::from_digest(*d, sample.data.len(), pod_tag))
                         } else {
-                            self.write_keyed_data(&sample.data, prop.data_type.pod)?
+                            let (_, key) = precomputed[offset].as_ref().expect("precomputed key");
+                            (*key.digest(), *key)
                         };
 
-                        let dims_offset = if sample.dims.len() <= 1
-                            && !matches!(
-                                prop.data_type.pod,
-                                PlainOldDataType::String | PlainOldDataType::Wstring
-                            )
-                        {
-                            EMPTY_DATA
+                        let key_changed = prev_key.as_ref().is_none_or(|k| *k != content_key);
+                        let dims_for_hash = if key_changed {
+                            &sample.dims
                         } else {
-                            let dims_data: Vec<u8> = sample
-                                .dims
-                                .iter()
-                                .flat_map(|dim| (*dim as u64).to_le_bytes())
-                                .collect();
-                            make_data_offset(self.write_data(&dims_data)?)
+                            prev_dims.as_ref().unwrap_or(&sample.dims)
                         };
 
-                        let num_points = sample.dims.iter().product::<usize>()
-                            * prop.data_type.extent as usize;
-                        if prop.data_type.extent != 1 {
-                            state.is_homogenous = false;
-                        } else if let Some(prev) = prev_num_points {
-                            if num_points != prev {
+                        let mut d = (
+                            u64::from_le_bytes(digest[0..8].try_into().unwrap()),
+                            u64::from_le_bytes(digest[8..16].try_into().unwrap()),
+                        );
+                        hash_dimensions(dims_for_hash, &mut d);
+                        state.sample_hash = match state.sample_hash {
+                            None => Some(d),
+                            Some((h0, h1)) => Some(SpookyHash::short_end_mix(h0, h1, d.0, d.1)),
+                        };
+
+                        if sample_index == 0 || key_changed {
+                            if sample_index > 0 && state.first_changed_index != 0 {
+                                for _ in (state.last_changed_index + 1)..sample_index {
+                                    if let (Some(pos), Some(dim_pos)) = (prev_data_pos, prev_dims_pos) {
+                                        state.children.push(make_data_offset(pos));
+                                        state.children.push(dim_pos);
+                                    }
+                                }
+                            }
+
+                            let data_pos = if sample.digest.is_some() {
+                                self.write_keyed_data_with_key(&sample.data, &digest, prop.data_type.pod)?
+                            } else {
+                                let (encoded, key) = precomputed[offset].as_ref().expect("precomputed key");
+                                self.write_keyed_data_precomputed(encoded, key)?
+                            };
+
+                            let dims_offset = if sample.dims.len() <= 1
+                                && !matches!(
+                                    prop.data_type.pod,
+                                    PlainOldDataType::String | PlainOldDataType::Wstring
+                                )
+                            {
+                                EMPTY_DATA
+                            } else {
+                                let dims_data: Vec<u8> = sample
+                                    .dims
+                                    .iter()
+                                    .flat_map(|dim| (*dim as u64).to_le_bytes())
+                                    .collect();
+                                make_data_offset(self.write_data(&dims_data)?)
+                            };
+
+                            let num_points = sample.dims.iter().product::<usize>()
+                                * prop.data_type.extent as usize;
+                            if prop.data_type.extent != 1 {
                                 state.is_homogenous = false;
+                            } else if let Some(prev) = prev_num_points {
+                                if num_points != prev {
+                                    state.is_homogenous = false;
+                                }
                             }
-                        }
-                        prev_num_points = Some(num_points);
-                        prev_dims = Some(sample.dims.clone());
-                        prev_dims_pos = Some(dims_offset);
-                        prev_data_pos = Some(data_pos);
-                        prev_key = Some(content_key);
-
-                        state.children.push(make_data_offset(data_pos));
-                        state.children.push(dims_offset);
-
-                        if sample_index != 0 {
-                            if state.first_changed_index == 0 {
-                                state.first_changed_index = sample_index;
+                            prev_num_points = Some(num_points);
+                            prev_dims = Some(sample.dims.clone());
+                            prev_dims_pos = Some(dims_offset);
+                            prev_data_pos = Some(data_pos);
+                            prev_key = Some(content_key);
+
+                            state.children.push(make_data_offset(data_pos));
+                            state.children.push(dims_offset);
+
+                            if sample_index != 0 {
+                                if state.first_changed_index == 0 {
+                                    state.first_changed_index = sample_index;
+                                }
+                                state.last_changed_index = sample_index;
                             }
-                            state.last_changed_index = sample_index;
                         }
+
+                        // Free the encoded bytes as soon as the sample is
+                        // consumed.
+                        precomputed[offset] = None;
                     }
                 }
 
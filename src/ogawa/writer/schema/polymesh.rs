@@ -41,12 +41,51 @@ impl OPolyMeshSample {
     }
 }
 
+/// Snap positions to a uniform per-axis grid with `2^bits` steps.
+///
+/// Scale/offset come from the per-axis min/max of the sample itself, so no
+/// metadata has to be stored: the snapped values are written back as plain
+/// float32, keeping the archive readable by any Alembic implementation.
+/// Snapping collapses near-equal coordinates, which improves sample
+/// deduplication and downstream compression at the cost of precision.
+fn quantize_positions(positions: &[glam::Vec3], bits: u32) -> Vec<glam::Vec3> {
+    if positions.is_empty() {
+        return Vec::new();
+    }
+    let mut min = positions[0];
+    let mut max = positions[0];
+    for p in &positions[1..] {
+        min = min.min(*p);
+        max = max.max(*p);
+    }
+    let steps = ((1u64 << bits) - 1) as f32;
+    let range = max - min;
+    // Per-axis scale; degenerate axes (range 0) snap everything to min.
+    let scale = range / steps;
+    positions
+        .iter()
+        .map(|p| {
+            let mut q = *p;
+            for axis in 0..3 {
+                if scale[axis] > 0.0 {
+                    q[axis] = min[axis] + ((p[axis] - min[axis]) / scale[axis]).round() * scale[axis];
+                } else {
+                    q[axis] = min[axis];
+                }
+            }
+            q
+        })
+        .collect()
+}
+
 /// PolyMesh schema writer.
 pub struct OPolyMesh {
     object: OObject,
     geom_compound: OProperty,
     arb_geom_compound: Option<OProperty>,
     time_sampling_index: u32,
+    /// Opt-in lossy position quantization (grid bits), see `set_position_quantization`.
+    position_quant_bits: Option<u32>,
 }
 
 impl OPolyMesh {
@@ -65,7 +104,23 @@ impl OPolyMesh {
         let mut geom = OProperty::compound(".geom");
         geom.meta_data = geom_meta;
 
-        Self { object, geom_compound: geom, arb_geom_compound: None, time_sampling_index: 0 }
+        Self {
+            object,
+            geom_compound: geom,
+            arb_geom_compound: None,
+            time_sampling_index: 0,
+            position_quant_bits: None,
+        }
+    }
+
+    /// Enable lossy position quantization for all subsequent samples.
+    ///
+    /// Positions are snapped to a per-axis grid with `2^bits` steps across
+    /// the sample's bounding box before being written (still as float32, so
+    /// the file stays standard Alembic). Typical value: 16 bits, which keeps
+    /// ~5 significant digits relative to the mesh extent. Off by default.
+    pub fn set_position_quantization(&mut self, bits: u32) {
+        self.position_quant_bits = Some(bits.clamp(1, 23));
     }
 
     /// Set time sampling index for animated properties.
@@ -170,13 +225,20 @@ impl OPolyMesh {
         // === STEP 2: Write data ===
         // The actual write order is determined by data_write_order field.
         
-        // P data
+        // P data (quantized first when opted in)
+        let quantized;
+        let positions: &[glam::Vec3] = if let Some(bits) = self.position_quant_bits {
+            quantized = quantize_positions(&sample.positions, bits);
+            &quantized
+        } else {
+            &sample.positions
+        };
         let positions_prop = self.get_or_create_array_with_meta(
             "P",
             DataType::new(PlainOldDataType::Float32, 3),
             p_meta,
         );
-        positions_prop.add_array_pod(&sample.positions);
+        positions_prop.add_array_pod(positions);
         
         // .faceIndices data
         let face_indices_prop = self.get_or_create_array_with_ts(
@@ -196,7 +258,7 @@ impl OPolyMesh {
         let bounds = if let Some(ref bnds) = sample.self_bounds {
             [bnds.min.x, bnds.min.y, bnds.min.z, bnds.max.x, bnds.max.y, bnds.max.z]
         } else {
-            compute_bounds_vec3(&sample.positions)
+            compute_bounds_vec3(positions)
         };
         let self_bnds_prop = self.get_or_create_scalar_with_meta(
             ".selfBnds",
@@ -265,6 +327,38 @@ impl OPolyMesh {
         }
     }
 
+    /// Add a positions-only sample, reusing the topology of the first sample.
+    ///
+    /// For constant-topology animation this skips re-submitting
+    /// .faceIndices/.faceCounts per frame; only P and .selfBnds get a new
+    /// sample. Must be called after at least one full `add_sample`.
+    pub fn add_positions_sample(&mut self, positions: &[glam::Vec3]) {
+        let quantized;
+        let positions: &[glam::Vec3] = if let Some(bits) = self.position_quant_bits {
+            quantized = quantize_positions(positions, bits);
+            &quantized
+        } else {
+            positions
+        };
+        let mut p_meta = MetaData::new();
+        p_meta.set("geoScope", "vtx");
+        p_meta.set("interpretation", "point");
+        let positions_prop = self.get_or_create_array_with_meta(
+            "P",
+            DataType::new(PlainOldDataType::Float32, 3),
+            p_meta,
+        );
+        positions_prop.add_array_pod(positions);
+
+        let bounds = compute_bounds_vec3(positions);
+        let self_bnds_prop = self.get_or_create_scalar_with_meta(
+            ".selfBnds",
+            DataType::new(PlainOldDataType::Float64, 6),
+            MetaData::new(),
+        );
+        self_bnds_prop.add_scalar_pod(&bounds);
+    }
+
     fn get_or_create_array_with_ts(&mut self, prop_name: &str, data_type: DataType) -> &mut OProperty {
         let ts_idx = self.time_sampling_index;
         if let OPropertyData::Compound(children) = &mut self.geom_compound.data {
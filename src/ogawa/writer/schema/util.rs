@@ -6,18 +6,25 @@ use crate::core::MetaData;
 
 /// Compute bounding box from positions.
 /// Matches AbcGeom writer behavior (min/max over points).
+///
+/// The scan runs in f32 with SIMD-backed `Vec3A` and widens once at the
+/// end: min/max are order statistics and f32 -> f64 conversion is exact
+/// and monotone, so the result is bit-identical to a per-point f64 scan.
 pub(crate) fn compute_bounds_vec3(positions: &[glam::Vec3]) -> [f64; 6] {
     if positions.is_empty() {
         return [0.0; 6];
     }
-    let mut min = glam::DVec3::splat(f64::MAX);
-    let mut max = glam::DVec3::splat(f64::MIN);
+    let mut min = glam::Vec3A::splat(f32::INFINITY);
+    let mut max = glam::Vec3A::splat(f32::NEG_INFINITY);
     for p in positions {
-        let p = glam::DVec3::new(p.x as f64, p.y as f64, p.z as f64);
+        let p = glam::Vec3A::from(*p);
         min = min.min(p);
         max = max.max(p);
     }
-    [min.x, min.y, min.z, max.x, max.y, max.z]
+    [
+        min.x as f64, min.y as f64, min.z as f64,
+        max.x as f64, max.y as f64, max.z as f64,
+    ]
 }
 
 /// Standard bounds metadata (interpretation=box).
@@ -16,9 +16,18 @@ pub struct OStream {
     pos: u64,
 }
 
+/// Default write-buffer size (2MB): Ogawa emits many small header/blob
+/// writes, so buffering keeps them off the syscall path.
+pub const DEFAULT_WRITE_BUFFER_SIZE: usize = 2 * 1024 * 1024;
+
 impl OStream {
     /// Create a new output stream for the given file path.
     pub fn create(path: impl AsRef<Path>) -> Result<Self> {
+        Self::create_with_capacity(path, DEFAULT_WRITE_BUFFER_SIZE)
+    }
+
+    /// Create a new output stream with an explicit write-buffer size.
+    pub fn create_with_capacity(path: impl AsRef<Path>, capacity: usize) -> Result<Self> {
         let file = OpenOptions::new()
             .write(true)
             .create(true)
@@ -26,7 +35,7 @@ impl OStream {
             .open(path)?;
 
         Ok(Self {
-            writer: BufWriter::with_capacity(2 * 1024 * 1024, file), // 2MB buffer
+            writer: BufWriter::with_capacity(capacity.max(1), file),
             pos: 0,
         })
     }
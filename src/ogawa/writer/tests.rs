@@ -72,6 +72,36 @@ fn test_write_polymesh() -> crate::util::Result<()> {
     Ok(())
 }
 
+#[test]
+fn test_write_polymesh_quantized() -> crate::util::Result<()> {
+    let temp = NamedTempFile::new()?;
+    let path = temp.path();
+
+    let mut archive = OArchive::create(path)?;
+
+    let mut mesh = OPolyMesh::new("triangle");
+    mesh.set_position_quantization(8);
+    mesh.add_sample(&OPolyMeshSample::new(
+        vec![
+            glam::Vec3::new(0.0, 0.0, 0.0),
+            glam::Vec3::new(1.0001, 0.0, 0.0),
+            glam::Vec3::new(0.5, 1.0, 0.0),
+        ],
+        vec![3],
+        vec![0, 1, 2],
+    ));
+
+    let mut root = OObject::new("");
+    root.add_child(mesh.build());
+
+    archive.write_archive(&root)?;
+
+    let reader = super::super::IArchive::open(path)?;
+    assert!(reader.is_valid());
+
+    Ok(())
+}
+
 #[test]
 fn test_write_xform() -> crate::util::Result<()> {
     let temp = NamedTempFile::new()?;
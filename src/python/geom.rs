@@ -10,8 +10,99 @@ use crate::geom::{
     IFaceSet, IGeomParam,
     visibility::{ObjectVisibility, OVisibilityProperty},
 };
+use std::os::raw::{c_char, c_int, c_void};
 use std::sync::Arc;
 
+// ============================================================================
+// Buffer views
+// ============================================================================
+
+/// Zero-copy float32 view over sample data, exported via the buffer
+/// protocol.
+///
+/// `memoryview(view)`, `array.array('f', view)` and `np.frombuffer(view,
+/// dtype=np.float32)` all read the Rust-side buffer directly, with no
+/// per-element boxing. The view holds an Arc, so the data outlives any
+/// consumer that keeps a buffer open.
+#[pyclass(name = "Float32BufferView")]
+pub struct PyFloat32BufferView {
+    data: Arc<Vec<f32>>,
+}
+
+#[pymethods]
+impl PyFloat32BufferView {
+    fn __len__(&self) -> usize {
+        self.data.len()
+    }
+
+    unsafe fn __getbuffer__(
+        slf: Bound<'_, Self>,
+        view: *mut pyo3::ffi::Py_buffer,
+        flags: c_int,
+    ) -> PyResult<()> {
+        static FORMAT: &[u8] = b"f\0";
+        let data = slf.borrow().data.clone();
+        let ret = pyo3::ffi::PyBuffer_FillInfo(
+            view,
+            slf.as_ptr(),
+            data.as_ptr() as *mut c_void,
+            (data.len() * std::mem::size_of::<f32>()) as pyo3::ffi::Py_ssize_t,
+            1, // read-only
+            flags,
+        );
+        if ret == -1 {
+            return Err(PyErr::fetch(slf.py()));
+        }
+        (*view).itemsize = std::mem::size_of::<f32>() as pyo3::ffi::Py_ssize_t;
+        (*view).format = FORMAT.as_ptr() as *mut c_char;
+        Ok(())
+    }
+
+    fn __repr__(&self) -> String {
+        format!("<Float32BufferView {} floats>", self.data.len())
+    }
+}
+
+/// Zero-copy int32 view over sample data; see `Float32BufferView`.
+#[pyclass(name = "Int32BufferView")]
+pub struct PyInt32BufferView {
+    data: Arc<Vec<i32>>,
+}
+
+#[pymethods]
+impl PyInt32BufferView {
+    fn __len__(&self) -> usize {
+        self.data.len()
+    }
+
+    unsafe fn __getbuffer__(
+        slf: Bound<'_, Self>,
+        view: *mut pyo3::ffi::Py_buffer,
+        flags: c_int,
+    ) -> PyResult<()> {
+        static FORMAT: &[u8] = b"i\0";
+        let data = slf.borrow().data.clone();
+        let ret = pyo3::ffi::PyBuffer_FillInfo(
+            view,
+            slf.as_ptr(),
+            data.as_ptr() as *mut c_void,
+            (data.len() * std::mem::size_of::<i32>()) as pyo3::ffi::Py_ssize_t,
+            1, // read-only
+            flags,
+        );
+        if ret == -1 {
+            return Err(PyErr::fetch(slf.py()));
+        }
+        (*view).itemsize = std::mem::size_of::<i32>() as pyo3::ffi::Py_ssize_t;
+        (*view).format = FORMAT.as_ptr() as *mut c_char;
+        Ok(())
+    }
+
+    fn __repr__(&self) -> String {
+        format!("<Int32BufferView {} ints>", self.data.len())
+    }
+}
+
 // ============================================================================
 // PolyMesh
 // ============================================================================
@@ -19,9 +110,10 @@ use std::sync::Arc;
 /// Python wrapper for PolyMesh sample data.
 #[pyclass(name = "PolyMeshSample")]
 pub struct PyPolyMeshSample {
-    pub positions: Vec<[f32; 3]>,
-    pub face_indices: Vec<i32>,
-    pub face_counts: Vec<i32>,
+    /// Flat xyz coordinates, shared with any live positionsView().
+    pub positions: Arc<Vec<f32>>,
+    pub face_indices: Arc<Vec<i32>>,
+    pub face_counts: Arc<Vec<i32>>,
     pub velocities: Option<Vec<[f32; 3]>>,
     pub normals: Option<Vec<[f32; 3]>>,
     pub uvs: Option<Vec<[f32; 2]>>,
@@ -33,19 +125,74 @@ impl PyPolyMeshSample {
     /// Vertex positions as list of [x, y, z].
     #[getter]
     pub fn positions(&self) -> Vec<[f32; 3]> {
-        self.positions.clone()
+        self.positions
+            .chunks_exact(3)
+            .map(|c| [c[0], c[1], c[2]])
+            .collect()
     }
-    
+
+    /// Vertex positions as a zero-copy flat float32 buffer (xyzxyz...).
+    ///
+    /// Unlike the positions getter this allocates no per-vertex objects;
+    /// wrap it with memoryview/array.array/np.frombuffer for bulk access.
+    pub fn positionsView(&self) -> PyFloat32BufferView {
+        PyFloat32BufferView { data: self.positions.clone() }
+    }
+
     /// Face vertex indices.
     #[getter]
     pub fn faceIndices(&self) -> Vec<i32> {
-        self.face_indices.clone()
+        self.face_indices.as_ref().clone()
     }
-    
+
+    /// Face vertex indices as a zero-copy int32 buffer (no per-index boxing).
+    pub fn faceIndicesView(&self) -> PyInt32BufferView {
+        PyInt32BufferView { data: self.face_indices.clone() }
+    }
+
+    /// Min and max face index in one Rust-side pass.
+    ///
+    /// Replaces Python-level max(sample.faceIndices) + min(...) — two
+    /// passes over boxed ints — with a single auto-vectorizable scan over
+    /// the contiguous i32 buffer. Returns (0, 0) for an empty sample.
+    pub fn faceIndicesBounds(&self) -> (i32, i32) {
+        if self.face_indices.is_empty() {
+            return (0, 0);
+        }
+        self.face_indices
+            .iter()
+            .fold((i32::MAX, i32::MIN), |(lo, hi), &x| (lo.min(x), hi.max(x)))
+    }
+
+    /// Validate face indices against the vertex count in one pass.
+    ///
+    /// Returns (min_index, max_index, out_of_range_count), where the count
+    /// is the number of indices outside [0, num_vertices). Replaces a
+    /// Python-level min/max/range-check loop over boxed ints with a single
+    /// scan of the contiguous i32 buffer. Returns (0, 0, 0) for an empty
+    /// sample.
+    pub fn validateIndices(&self) -> (i32, i32, usize) {
+        if self.face_indices.is_empty() {
+            return (0, 0, 0);
+        }
+        let n = (self.positions.len() / 3) as i32;
+        self.face_indices.iter().fold(
+            (i32::MAX, i32::MIN, 0usize),
+            |(lo, hi, bad), &x| {
+                (lo.min(x), hi.max(x), bad + (x < 0 || x >= n) as usize)
+            },
+        )
+    }
+
     /// Number of vertices per face.
     #[getter]
     pub fn faceCounts(&self) -> Vec<i32> {
-        self.face_counts.clone()
+        self.face_counts.as_ref().clone()
+    }
+
+    /// Per-face vertex counts as a zero-copy int32 buffer.
+    pub fn faceCountsView(&self) -> PyInt32BufferView {
+        PyInt32BufferView { data: self.face_counts.clone() }
     }
     
     /// Vertex velocities (optional).
@@ -74,30 +221,30 @@ impl PyPolyMeshSample {
     
     /// Number of vertices.
     pub fn getNumVertices(&self) -> usize {
-        self.positions.len()
+        self.positions.len() / 3
     }
-    
+
     /// Number of faces.
     pub fn getNumFaces(&self) -> usize {
         self.face_counts.len()
     }
-    
+
     fn __len__(&self) -> usize {
-        self.positions.len()
+        self.positions.len() / 3
     }
-    
+
     fn __repr__(&self) -> String {
-        format!("<PolyMeshSample {} verts, {} faces>", 
-            self.positions.len(), self.face_counts.len())
+        format!("<PolyMeshSample {} verts, {} faces>",
+            self.positions.len() / 3, self.face_counts.len())
     }
 }
 
 impl From<PolyMeshSample> for PyPolyMeshSample {
     fn from(s: PolyMeshSample) -> Self {
         Self {
-            positions: s.positions.iter().map(|p| [p.x, p.y, p.z]).collect(),
-            face_indices: s.face_indices,
-            face_counts: s.face_counts,
+            positions: Arc::new(s.positions.iter().flat_map(|p| [p.x, p.y, p.z]).collect()),
+            face_indices: Arc::new(s.face_indices),
+            face_counts: Arc::new(s.face_counts),
             velocities: s.velocities.map(|v| v.iter().map(|p| [p.x, p.y, p.z]).collect()),
             normals: s.normals.map(|v| v.iter().map(|p| [p.x, p.y, p.z]).collect()),
             uvs: s.uvs.map(|v| v.iter().map(|p| [p.x, p.y]).collect()),
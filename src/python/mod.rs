@@ -130,6 +130,8 @@ fn alembic_rs(m: &Bound<'_, PyModule>) -> PyResult<()> {
     abc_geom.add("kVisibilityDeferred", -1i8)?;
     abc_geom.add("kVisibilityHidden", 0i8)?;
     abc_geom.add("kVisibilityVisible", 1i8)?;
+    abc_geom.add_class::<geom::PyFloat32BufferView>()?;
+    abc_geom.add_class::<geom::PyInt32BufferView>()?;
     abc_geom.add_class::<geom::PyPolyMeshSample>()?;
     abc_geom.add_class::<geom::PySubDSample>()?;
     abc_geom.add_class::<geom::PyCurvesSample>()?;
@@ -183,6 +185,7 @@ fn alembic_rs(m: &Bound<'_, PyModule>) -> PyResult<()> {
     abc.add_class::<write::PyOFaceSet>()?;
     abc.add_class::<write::PyOMaterial>()?;
     abc.add_class::<write::PyOCollections>()?;
+    abc.add_class::<write::PyDtype>()?;
     abc.add_class::<write::PyOScalarProperty>()?;
     abc.add_class::<write::PyOArrayProperty>()?;
     abc.add_class::<write::PyOCompoundProperty>()?;
@@ -204,6 +207,7 @@ fn alembic_rs(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<write::PyOArchive>()?;
     m.add_class::<write::PyOPolyMesh>()?;
     m.add_class::<write::PyOXform>()?;
+    m.add_class::<write::PyDtype>()?;
     // Schema readers at top level
     m.add_class::<schemas::PyIPolyMesh>()?;
     m.add_class::<schemas::PyIXform>()?;
@@ -216,6 +220,8 @@ fn alembic_rs(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<schemas::PyIFaceSetTyped>()?;
     m.add_class::<schemas::PyIFaceSetSchema>()?;
     // Samples at top level
+    m.add_class::<geom::PyFloat32BufferView>()?;
+    m.add_class::<geom::PyInt32BufferView>()?;
     m.add_class::<geom::PyPolyMeshSample>()?;
     m.add_class::<geom::PyXformSample>()?;
     m.add_class::<geom::PySubDSample>()?;
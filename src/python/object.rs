@@ -8,6 +8,7 @@ use std::sync::Arc;
 
 use crate::abc::IArchive;
 use crate::geom::{IPolyMesh, ISubD, ICurves, IPoints, ICamera, ILight, IXform, INuPatch, IFaceSet, IGeomParam};
+use crate::geom::{CAMERA_SCHEMA, POLYMESH_SCHEMA, XFORM_SCHEMA};
 use crate::geom::visibility::{get_visibility, is_visible};
 use super::geom::{
     PyPolyMeshSample, PySubDSample, PyCurvesSample, PyPointsSample,
@@ -23,6 +24,10 @@ use super::properties::PyICompoundProperty;
 pub struct PyIObject {
     pub(crate) archive: Arc<IArchive>,
     pub(crate) path: Vec<String>,
+    /// Full path string, built once at construction by extending the
+    /// parent's path instead of re-joining the segment list on every
+    /// getFullName call.
+    pub(crate) full_name: String,
 }
 
 impl PyIObject {
@@ -31,6 +36,24 @@ impl PyIObject {
         Self {
             archive,
             path: Vec::new(),
+            full_name: "/".to_string(),
+        }
+    }
+
+    /// Build the wrapper for a direct child: one push onto the path and
+    /// one append onto the cached full name.
+    fn descend(&self, name: String) -> Self {
+        let full_name = if self.path.is_empty() {
+            format!("/{}", name)
+        } else {
+            format!("{}/{}", self.full_name, name)
+        };
+        let mut path = self.path.clone();
+        path.push(name);
+        Self {
+            archive: self.archive.clone(),
+            path,
+            full_name,
         }
     }
     
@@ -63,6 +86,37 @@ impl PyIObject {
     }
 }
 
+/// Append one tree line per object under `obj` (recursive helper for
+/// `formatTree`).
+fn format_tree_node(obj: &crate::abc::IObject, name: &str, indent: usize, out: &mut String) {
+    let icon = match obj.getMetaData().schema() {
+        Some(XFORM_SCHEMA) => "[X]",
+        Some(POLYMESH_SCHEMA) => "[M]",
+        Some(CAMERA_SCHEMA) => "[C]",
+        _ => "[O]",
+    };
+    let prefix = "  ".repeat(indent);
+    out.push_str(&prefix);
+    out.push_str(icon);
+    out.push(' ');
+    out.push_str(name);
+    out.push('\n');
+
+    if let Some(xform) = IXform::new(obj) {
+        if let Ok(sample) = xform.getSample(0) {
+            let t = sample.translation();
+            out.push_str(&format!("{}   pos: ({:.1}, {:.1}, {:.1})\n", prefix, t.x, t.y, t.z));
+        }
+    }
+
+    for i in 0..obj.getNumChildren() {
+        if let Some(child) = obj.getChild(i) {
+            let child_name = child.getName().to_string();
+            format_tree_node(&child, &child_name, indent + 1, out);
+        }
+    }
+}
+
 #[pymethods]
 impl PyIObject {
     /// Get object name.
@@ -72,11 +126,7 @@ impl PyIObject {
     
     /// Get full path.
     fn getFullName(&self) -> String {
-        if self.path.is_empty() {
-            "/".to_string()
-        } else {
-            format!("/{}", self.path.join("/"))
-        }
+        self.full_name.clone()
     }
     
     /// Get number of children.
@@ -89,14 +139,8 @@ impl PyIObject {
         let child_name = self.with_object(|obj| {
             obj.getChild(index).map(|c| c.getName().to_string())
         }).ok_or_else(|| PyValueError::new_err("Child index out of range"))?;
-        
-        let mut new_path = self.path.clone();
-        new_path.push(child_name);
-        
-        Ok(PyIObject {
-            archive: self.archive.clone(),
-            path: new_path,
-        })
+
+        Ok(self.descend(child_name))
     }
     
     /// Get child by name.
@@ -109,14 +153,8 @@ impl PyIObject {
         if !exists {
             return Err(PyValueError::new_err(format!("Child '{}' not found", name)));
         }
-        
-        let mut new_path = self.path.clone();
-        new_path.push(name.to_string());
-        
-        Ok(PyIObject {
-            archive: self.archive.clone(),
-            path: new_path,
-        })
+
+        Ok(self.descend(name.to_string()))
     }
     
     /// Get parent object.
@@ -127,10 +165,16 @@ impl PyIObject {
         
         let mut parent_path = self.path.clone();
         parent_path.pop();
-        
+        let full_name = if parent_path.is_empty() {
+            "/".to_string()
+        } else {
+            format!("/{}", parent_path.join("/"))
+        };
+
         Some(PyIObject {
             archive: self.archive.clone(),
             path: parent_path,
+            full_name,
         })
     }
     
@@ -146,13 +190,43 @@ impl PyIObject {
         }).unwrap_or_default()
     }
     
+    /// Get all children in one call.
+    ///
+    /// Resolves this object once and builds every child wrapper from it,
+    /// instead of one getNumChildren() plus one getChild() FFI round-trip
+    /// (each re-traversing from the root) per child.
+    fn getChildren(&self) -> Vec<PyIObject> {
+        self.with_object(|obj| {
+            let num = obj.getNumChildren();
+            let mut children = Vec::with_capacity(num);
+            for i in 0..num {
+                if let Some(child) = obj.getChild(i) {
+                    children.push(self.descend(child.getName().to_string()));
+                }
+            }
+            Some(children)
+        }).unwrap_or_default()
+    }
+
     /// Children as list.
     #[getter]
     fn children(&self) -> Vec<PyIObject> {
-        let num = self.getNumChildren();
-        (0..num)
-            .filter_map(|i| self.getChild(i).ok())
-            .collect()
+        self.getChildren()
+    }
+
+    /// Render this subtree as an indented text tree in a single call.
+    ///
+    /// One "[X] name" line per object, plus a "pos:" line for xforms with
+    /// a sample (the hierarchy example's format). The whole string is
+    /// built during one Rust-side walk, so printing a tree costs one FFI
+    /// crossing instead of several per node.
+    fn formatTree(&self) -> String {
+        let name = self.getName();
+        self.with_object(|obj| {
+            let mut out = String::new();
+            format_tree_node(obj, &name, 0, &mut out);
+            Some(out)
+        }).unwrap_or_default()
     }
     
     /// Get number of samples.
@@ -207,6 +281,23 @@ impl PyIObject {
     pub fn isFaceSet(&self) -> bool {
         self.with_object(|obj| Some(IFaceSet::new(obj).is_some())).unwrap_or(false)
     }
+
+    /// Single-call type tag: 0 = other, 1 = Xform, 2 = PolyMesh, 3 = Camera.
+    ///
+    /// Resolves the object once and reads the schema metadata entry once,
+    /// instead of a chain of is*() calls each re-resolving the path and
+    /// re-probing the metadata. Python dispatch tables can index on the
+    /// result.
+    pub fn typeCode(&self) -> u8 {
+        self.with_object(|obj| {
+            Some(match obj.getMetaData().schema() {
+                Some(XFORM_SCHEMA) => 1,
+                Some(POLYMESH_SCHEMA) => 2,
+                Some(CAMERA_SCHEMA) => 3,
+                _ => 0,
+            })
+        }).unwrap_or(0)
+    }
     
     // ========================================================================
     // Get samples
@@ -265,6 +356,18 @@ impl PyIObject {
             xform.getSample(index).ok().map(|s| s.into())
         }).ok_or_else(|| PyValueError::new_err("Not an Xform or failed to get sample"))
     }
+
+    /// Get Xform sample at index, or None instead of raising.
+    ///
+    /// Non-raising variant for traversal loops: skips the exception
+    /// allocation and unwind when an object has no such sample.
+    #[pyo3(signature = (index=0))]
+    fn tryGetXformSample(&self, index: usize) -> Option<PyXformSample> {
+        self.with_object(|obj| {
+            let xform = IXform::new(obj)?;
+            xform.getSample(index).ok().map(|s| s.into())
+        })
+    }
     
     /// Get Light sample at index.
     #[pyo3(signature = (index=0))]
@@ -614,6 +717,7 @@ impl Clone for PyIObject {
         Self {
             archive: self.archive.clone(),
             path: self.path.clone(),
+            full_name: self.full_name.clone(),
         }
     }
 }
@@ -3,7 +3,9 @@
 #![allow(non_snake_case)]
 
 use pyo3::prelude::*;
+use pyo3::buffer::PyBuffer;
 use pyo3::exceptions::{PyValueError, PyIOError};
+use pyo3::types::{PyList, PyString};
 use std::sync::{Arc, Mutex};
 
 
@@ -18,6 +20,77 @@ use crate::core::TimeSampling;
 use crate::geom::{CurveType, CurvePeriodicity, BasisType, CameraSample};
 use crate::material::{ShaderParam, ShaderParamValue};
 
+// ============================================================================
+// Ingress helpers
+// ============================================================================
+
+/// Extract Vec3 data from a flat f32 buffer (array.array('f'), NumPy
+/// float32, memoryview) in one pass, or fall back to a nested list of
+/// [x, y, z] or a flat list of scalars with per-element extraction.
+fn extract_vec3s(data: &Bound<'_, PyAny>) -> PyResult<Vec<glam::Vec3>> {
+    let flat = if let Ok(buf) = PyBuffer::<f32>::get(data) {
+        buf.to_vec(data.py())?
+    } else if let Ok(nested) = data.extract::<Vec<[f32; 3]>>() {
+        return Ok(nested.iter().map(|p| glam::Vec3::new(p[0], p[1], p[2])).collect());
+    } else {
+        data.extract::<Vec<f32>>()?
+    };
+    if flat.len() % 3 != 0 {
+        return Err(PyValueError::new_err(format!(
+            "Flat float data length {} is not a multiple of 3", flat.len())));
+    }
+    Ok(flat.chunks_exact(3)
+        .map(|c| glam::Vec3::new(c[0], c[1], c[2]))
+        .collect())
+}
+
+/// Extract Vec2 data from a flat f32 buffer in one pass, or fall back
+/// to a nested list of [u, v] or a flat list of scalars with per-element
+/// extraction.
+fn extract_vec2s(data: &Bound<'_, PyAny>) -> PyResult<Vec<glam::Vec2>> {
+    let flat = if let Ok(buf) = PyBuffer::<f32>::get(data) {
+        buf.to_vec(data.py())?
+    } else if let Ok(nested) = data.extract::<Vec<[f32; 2]>>() {
+        return Ok(nested.iter().map(|p| glam::Vec2::new(p[0], p[1])).collect());
+    } else {
+        data.extract::<Vec<f32>>()?
+    };
+    if flat.len() % 2 != 0 {
+        return Err(PyValueError::new_err(format!(
+            "Flat float data length {} is not a multiple of 2", flat.len())));
+    }
+    Ok(flat.chunks_exact(2)
+        .map(|c| glam::Vec2::new(c[0], c[1]))
+        .collect())
+}
+
+/// Extract i32 data from a flat buffer (array.array('i'), NumPy int32)
+/// in one pass, or fall back to a list of ints.
+fn extract_i32s(data: &Bound<'_, PyAny>) -> PyResult<Vec<i32>> {
+    if let Ok(buf) = PyBuffer::<i32>::get(data) {
+        return buf.to_vec(data.py());
+    }
+    data.extract()
+}
+
+/// Extract f32 data from a flat buffer (array.array('f'), NumPy float32)
+/// in one pass, or fall back to a list of floats.
+fn extract_f32s(data: &Bound<'_, PyAny>) -> PyResult<Vec<f32>> {
+    if let Ok(buf) = PyBuffer::<f32>::get(data) {
+        return buf.to_vec(data.py());
+    }
+    data.extract()
+}
+
+/// Extract f64 data from a flat buffer (array.array('d'), NumPy float64)
+/// in one pass, or fall back to a list of floats.
+fn extract_f64s(data: &Bound<'_, PyAny>) -> PyResult<Vec<f64>> {
+    if let Ok(buf) = PyBuffer::<f64>::get(data) {
+        return buf.to_vec(data.py());
+    }
+    data.extract()
+}
+
 // ============================================================================
 // OArchive wrapper
 // ============================================================================
@@ -31,11 +104,19 @@ pub struct PyOArchive {
 #[pymethods]
 impl PyOArchive {
     /// Create a new Alembic archive for writing.
+    ///
+    /// `buffer_size` overrides the default 2MB write buffer; Ogawa emits
+    /// many small header/blob writes, so buffering keeps them off the
+    /// syscall path.
     #[staticmethod]
-    fn create(path: &str) -> PyResult<Self> {
-        let archive = OArchive::create(path)
-            .map_err(|e| PyIOError::new_err(format!("Failed to create archive: {}", e)))?;
-        
+    #[pyo3(signature = (path, buffer_size=None))]
+    fn create(path: &str, buffer_size: Option<usize>) -> PyResult<Self> {
+        let archive = match buffer_size {
+            Some(size) => OArchive::create_with_buffer_size(path, size),
+            None => OArchive::create(path),
+        }
+        .map_err(|e| PyIOError::new_err(format!("Failed to create archive: {}", e)))?;
+
         Ok(Self {
             archive: Arc::new(Mutex::new(Some(archive))),
         })
@@ -134,13 +215,18 @@ impl PyOArchive {
     }
     
     /// Write the root object hierarchy and finalize.
-    fn writeArchive(&self, root: &PyOObject) -> PyResult<()> {
+    ///
+    /// The GIL is released for the duration of the write, so other Python
+    /// threads (e.g. parallel test workers) can run while the bulk
+    /// encode/IO happens.
+    fn writeArchive(&self, py: Python<'_>, root: &PyOObject) -> PyResult<()> {
         let mut guard = self.archive.lock().map_err(|e| PyValueError::new_err(format!("Archive lock poisoned in writeArchive(): {}", e)))?;
         let archive = guard.as_mut().ok_or_else(|| PyValueError::new_err("Archive already closed"))?;
-        
-        archive.write_archive(&root.inner)
+
+        let root_obj = &root.inner;
+        py.detach(|| archive.write_archive(root_obj))
             .map_err(|e| PyIOError::new_err(format!("Failed to write archive: {}", e)))?;
-        
+
         Ok(())
     }
     
@@ -354,6 +440,9 @@ impl PyOObject {
 pub struct PyOPolyMesh {
     pub(crate) inner: Option<OPolyMesh>,
     name: String,
+    /// Topology set via setTopology(), reused by addPositionsSample().
+    topology: Option<(Vec<i32>, Vec<i32>)>,
+    num_samples: usize,
 }
 
 impl PyOPolyMesh {
@@ -378,53 +467,145 @@ impl PyOPolyMesh {
         Self {
             inner: Some(OPolyMesh::new(name)),
             name: name.to_string(),
+            topology: None,
+            num_samples: 0,
         }
     }
-    
+
     /// Get object name.
     fn getName(&self) -> &str {
         &self.name
     }
-    
+
     /// Check if this object has been consumed (added to a parent).
     fn isConsumed(&self) -> bool {
         self.inner.is_none()
     }
+
+    /// Enable lossy position quantization (grid snap, `2^bits` steps per axis).
+    ///
+    /// Positions are still stored as float32, so the file stays standard
+    /// Alembic; snapping improves dedup/compression at the cost of precision.
+    #[pyo3(signature = (bits=16))]
+    fn setPositionQuantization(&mut self, bits: u32) -> PyResult<()> {
+        self.inner_mut()?.set_position_quantization(bits);
+        Ok(())
+    }
+
+    /// Set shared topology for subsequent addPositionsSample() calls.
+    fn setTopology(&mut self, face_counts: &Bound<'_, PyAny>, face_indices: &Bound<'_, PyAny>) -> PyResult<()> {
+        self.topology = Some((extract_i32s(face_counts)?, extract_i32s(face_indices)?));
+        Ok(())
+    }
+
+    /// Add a positions-only sample, reusing the topology from setTopology().
+    ///
+    /// The first call writes a full sample (positions + topology); later
+    /// calls only submit positions, so the index buffers cross the FFI
+    /// boundary once per mesh instead of once per frame.
+    fn addPositionsSample(&mut self, positions: &Bound<'_, PyAny>) -> PyResult<()> {
+        let (face_counts, face_indices) = self.topology.clone()
+            .ok_or_else(|| PyValueError::new_err("setTopology() must be called before addPositionsSample()"))?;
+
+        let pos = extract_vec3s(positions)?;
+
+        let first_sample = self.num_samples == 0;
+        let inner = self.inner_mut()?;
+        if first_sample {
+            let sample = OPolyMeshSample::new(pos, face_counts, face_indices);
+            inner.add_sample(&sample);
+        } else {
+            inner.add_positions_sample(&pos);
+        }
+        self.num_samples += 1;
+        Ok(())
+    }
     
     /// Add a sample with positions, face counts, and face indices.
+    ///
+    /// Positions and indices accept flat buffers (array.array, NumPy)
+    /// for single-pass extraction, as well as nested or flat lists.
     #[pyo3(signature = (positions, face_counts, face_indices, normals=None, uvs=None))]
     fn addSample(
         &mut self,
-        positions: Vec<[f32; 3]>,
-        face_counts: Vec<i32>,
-        face_indices: Vec<i32>,
-        normals: Option<Vec<[f32; 3]>>,
-        uvs: Option<Vec<[f32; 2]>>,
+        positions: &Bound<'_, PyAny>,
+        face_counts: &Bound<'_, PyAny>,
+        face_indices: &Bound<'_, PyAny>,
+        normals: Option<&Bound<'_, PyAny>>,
+        uvs: Option<&Bound<'_, PyAny>>,
     ) -> PyResult<()> {
-        let inner = self.inner_mut()?;
-        
-        let pos: Vec<glam::Vec3> = positions.iter()
-            .map(|p| glam::Vec3::new(p[0], p[1], p[2]))
-            .collect();
-        
+        let pos = extract_vec3s(positions)?;
+        let face_counts = extract_i32s(face_counts)?;
+        let face_indices = extract_i32s(face_indices)?;
+
         let mut sample = OPolyMeshSample::new(pos, face_counts, face_indices);
-        
+
         if let Some(norms) = normals {
-            sample.normals = Some(norms.iter()
-                .map(|n| glam::Vec3::new(n[0], n[1], n[2]))
-                .collect());
+            sample.normals = Some(extract_vec3s(norms)?);
         }
-        
+
         if let Some(uv_data) = uvs {
-            sample.uvs = Some(uv_data.iter()
-                .map(|u| glam::Vec2::new(u[0], u[1]))
-                .collect());
+            sample.uvs = Some(extract_vec2s(uv_data)?);
         }
-        
-        inner.add_sample(&sample);
+
+        self.inner_mut()?.add_sample(&sample);
+        self.num_samples += 1;
         Ok(())
     }
-    
+
+    /// Add a triangle-soup sample: every three positions form one triangle.
+    ///
+    /// Fast path for triangulated data. face_counts ([3, 3, ...]) and the
+    /// sequential face_indices are built Rust-side, so only positions cross
+    /// the FFI boundary.
+    fn addTriangleSample(&mut self, positions: &Bound<'_, PyAny>) -> PyResult<()> {
+        let pos = extract_vec3s(positions)?;
+        if pos.len() % 3 != 0 {
+            return Err(PyValueError::new_err(format!(
+                "Triangle soup needs a multiple of 3 positions, got {}", pos.len())));
+        }
+        let face_counts = vec![3; pos.len() / 3];
+        let face_indices: Vec<i32> = (0..pos.len() as i32).collect();
+
+        let sample = OPolyMeshSample::new(pos, face_counts, face_indices);
+        self.inner_mut()?.add_sample(&sample);
+        self.num_samples += 1;
+        Ok(())
+    }
+
+    /// Add one sample per frame of positions, sharing one topology.
+    ///
+    /// Bulk variant of addSample() for animated meshes: the whole frame
+    /// batch crosses the FFI boundary in a single call, and topology is
+    /// written only with the first sample.
+    fn addSamples(
+        &mut self,
+        positions_frames: &Bound<'_, PyAny>,
+        face_counts: &Bound<'_, PyAny>,
+        face_indices: &Bound<'_, PyAny>,
+    ) -> PyResult<()> {
+        let face_counts = extract_i32s(face_counts)?;
+        let face_indices = extract_i32s(face_indices)?;
+
+        let mut frames = Vec::new();
+        for frame in positions_frames.try_iter()? {
+            frames.push(extract_vec3s(&frame?)?);
+        }
+
+        for pos in frames {
+            let first_sample = self.num_samples == 0;
+            let inner = self.inner_mut()?;
+            if first_sample {
+                let sample = OPolyMeshSample::new(pos, face_counts.clone(), face_indices.clone());
+                inner.add_sample(&sample);
+            } else {
+                inner.add_positions_sample(&pos);
+            }
+            self.num_samples += 1;
+        }
+        Ok(())
+    }
+
     fn __repr__(&self) -> String {
         let status = if self.inner.is_none() { " (consumed)" } else { "" };
         format!("<OPolyMesh '{}'{}>", self.name, status)
@@ -495,12 +676,38 @@ impl PyOXform {
         Ok(())
     }
     
+    /// Add one sample per 4x4 matrix (row-major, f32) in a single call.
+    ///
+    /// Bulk variant of addMatrixSample() for animated transforms: the
+    /// whole matrix batch crosses the FFI boundary once.
+    #[pyo3(signature = (matrices, inherits=true))]
+    fn addMatrixSamples(&mut self, matrices: Vec<[[f32; 4]; 4]>, inherits: bool) -> PyResult<()> {
+        let inner = self.inner_mut()?;
+        for matrix in &matrices {
+            let m = glam::Mat4::from_cols_array_2d(matrix).transpose();
+            inner.add_sample(OXformSample::from_matrix(m, inherits));
+        }
+        Ok(())
+    }
+
     /// Add sample from translation.
     fn addTranslationSample(&mut self, x: f32, y: f32, z: f32) -> PyResult<()> {
         let m = glam::Mat4::from_translation(glam::Vec3::new(x, y, z));
         self.inner_mut()?.add_sample(OXformSample::from_matrix(m, true));
         Ok(())
     }
+
+    /// Add one sample per translation in a single call.
+    ///
+    /// Bulk variant of addTranslationSample() for animated transforms.
+    fn addTranslationSamples(&mut self, translations: Vec<[f32; 3]>) -> PyResult<()> {
+        let inner = self.inner_mut()?;
+        for t in &translations {
+            let m = glam::Mat4::from_translation(glam::Vec3::new(t[0], t[1], t[2]));
+            inner.add_sample(OXformSample::from_matrix(m, true));
+        }
+        Ok(())
+    }
     
     /// Add sample from scale.
     fn addScaleSample(&mut self, x: f32, y: f32, z: f32) -> PyResult<()> {
@@ -1366,6 +1573,104 @@ impl PyOCollections {
 // Property Writing Support
 // ============================================================================
 
+/// Property data type tag, mirroring the names parse_data_type accepts.
+///
+/// Passing a Dtype to the property constructors skips the per-call string
+/// normalization and name match; type-name strings keep working.
+#[pyclass(name = "Dtype", eq, eq_int)]
+#[derive(Clone, Copy, PartialEq)]
+pub enum PyDtype {
+    Bool,
+    UInt8,
+    Int8,
+    UInt16,
+    Int16,
+    UInt32,
+    Int32,
+    UInt64,
+    Int64,
+    Float16,
+    Float32,
+    Float64,
+    String,
+    Vec2f,
+    Vec3f,
+    Vec4f,
+    Vec2d,
+    Vec3d,
+    Vec4d,
+    Vec2i,
+    Vec3i,
+    Mat33f,
+    Mat44f,
+}
+
+impl PyDtype {
+    fn data_type(self) -> DataType {
+        match self {
+            PyDtype::Bool => DataType::BOOL,
+            PyDtype::UInt8 => DataType::UINT8,
+            PyDtype::Int8 => DataType::INT8,
+            PyDtype::UInt16 => DataType::UINT16,
+            PyDtype::Int16 => DataType::INT16,
+            PyDtype::UInt32 => DataType::UINT32,
+            PyDtype::Int32 => DataType::INT32,
+            PyDtype::UInt64 => DataType::UINT64,
+            PyDtype::Int64 => DataType::INT64,
+            PyDtype::Float16 => DataType::FLOAT16,
+            PyDtype::Float32 => DataType::FLOAT32,
+            PyDtype::Float64 => DataType::FLOAT64,
+            PyDtype::String => DataType::STRING,
+            PyDtype::Vec2f => DataType::VEC2F,
+            PyDtype::Vec3f => DataType::VEC3F,
+            PyDtype::Vec4f => DataType::VEC4F,
+            PyDtype::Vec2d => DataType::VEC2D,
+            PyDtype::Vec3d => DataType::VEC3D,
+            PyDtype::Vec4d => DataType::VEC4D,
+            PyDtype::Vec2i => DataType::VEC2I,
+            PyDtype::Vec3i => DataType::VEC3I,
+            PyDtype::Mat33f => DataType::MAT33F,
+            PyDtype::Mat44f => DataType::MAT44F,
+        }
+    }
+}
+
+/// Resolve a data type argument: Dtype enum fast path, or type-name string.
+///
+/// Common type-name strings are matched by object identity against interned
+/// constants before falling back to UTF-8 extraction. CPython interns short
+/// identifier-like literals, so a `"float"` written at a call site is the
+/// same object as the interned constant here and resolves with pointer
+/// comparisons only — no per-call String allocation or lowercasing.
+fn resolve_data_type(arg: &Bound<'_, PyAny>) -> PyResult<DataType> {
+    if let Ok(dt) = arg.extract::<PyDtype>() {
+        return Ok(dt.data_type());
+    }
+    let py = arg.py();
+    for (name, dt) in [
+        (pyo3::intern!(py, "bool"), DataType::BOOL),
+        (pyo3::intern!(py, "int"), DataType::INT32),
+        (pyo3::intern!(py, "int32"), DataType::INT32),
+        (pyo3::intern!(py, "uint32"), DataType::UINT32),
+        (pyo3::intern!(py, "int64"), DataType::INT64),
+        (pyo3::intern!(py, "float"), DataType::FLOAT32),
+        (pyo3::intern!(py, "float32"), DataType::FLOAT32),
+        (pyo3::intern!(py, "double"), DataType::FLOAT64),
+        (pyo3::intern!(py, "float64"), DataType::FLOAT64),
+        (pyo3::intern!(py, "string"), DataType::STRING),
+        (pyo3::intern!(py, "vec2f"), DataType::VEC2F),
+        (pyo3::intern!(py, "vec3f"), DataType::VEC3F),
+        (pyo3::intern!(py, "vec3d"), DataType::VEC3D),
+    ] {
+        if arg.is(name) {
+            return Ok(dt);
+        }
+    }
+    let type_str: &str = arg.extract()?;
+    parse_data_type(type_str)
+        .ok_or_else(|| PyValueError::new_err(format!("Unknown data type: {}", type_str)))
+}
+
 /// Parse data type string to DataType.
 fn parse_data_type(type_str: &str) -> Option<DataType> {
     match type_str.to_lowercase().as_str() {
@@ -1408,15 +1713,14 @@ pub struct PyOScalarProperty {
 #[pymethods]
 impl PyOScalarProperty {
     /// Create a new scalar property.
-    /// 
-    /// Type can be: "int", "float", "double", "bool", "string",
-    /// "vec2f", "vec3f", "vec4f", "vec2d", "vec3d", etc.
+    ///
+    /// Type can be a Dtype tag or a name string: "int", "float", "double",
+    /// "bool", "string", "vec2f", "vec3f", "vec4f", "vec2d", "vec3d", etc.
     #[new]
     #[pyo3(signature = (name, data_type, time_sampling_index=0))]
-    fn new(name: &str, data_type: &str, time_sampling_index: u32) -> PyResult<Self> {
-        let dt = parse_data_type(data_type)
-            .ok_or_else(|| PyValueError::new_err(format!("Unknown data type: {}", data_type)))?;
-        
+    fn new(name: &str, data_type: &Bound<'_, PyAny>, time_sampling_index: u32) -> PyResult<Self> {
+        let dt = resolve_data_type(data_type)?;
+
         let mut prop = OProperty::scalar(name, dt);
         prop.time_sampling_index = time_sampling_index;
         
@@ -1442,7 +1746,48 @@ impl PyOScalarProperty {
     fn addSampleDouble(&mut self, value: f64) {
         self.inner.add_scalar_pod(&value);
     }
-    
+
+    /// Add one float sample per element of a flat buffer or list.
+    ///
+    /// Bulk variant of addSampleFloat() for animated properties: the whole
+    /// value batch crosses the FFI boundary in a single call.
+    fn addSamplesFloat(&mut self, values: &Bound<'_, PyAny>) -> PyResult<()> {
+        for value in extract_f32s(values)? {
+            self.inner.add_scalar_pod(&value);
+        }
+        Ok(())
+    }
+
+    /// Add one int sample per element of a flat buffer or list.
+    ///
+    /// Bulk variant of addSampleInt(); see addSamplesFloat().
+    fn addSamplesInt(&mut self, values: &Bound<'_, PyAny>) -> PyResult<()> {
+        for value in extract_i32s(values)? {
+            self.inner.add_scalar_pod(&value);
+        }
+        Ok(())
+    }
+
+    /// Add one double sample per element of a flat buffer or list.
+    ///
+    /// Bulk variant of addSampleDouble(); see addSamplesFloat().
+    fn addSamplesDouble(&mut self, values: &Bound<'_, PyAny>) -> PyResult<()> {
+        for value in extract_f64s(values)? {
+            self.inner.add_scalar_pod(&value);
+        }
+        Ok(())
+    }
+
+    /// Add one bool sample per element of a list.
+    ///
+    /// Bulk variant of addSampleBool(); see addSamplesFloat().
+    fn addSamplesBool(&mut self, values: Vec<bool>) {
+        for value in values {
+            let v: u8 = if value { 1 } else { 0 };
+            self.inner.add_scalar_pod(&v);
+        }
+    }
+
     /// Add a boolean sample.
     fn addSampleBool(&mut self, value: bool) {
         let v: u8 = if value { 1 } else { 0 };
@@ -1503,12 +1848,13 @@ pub struct PyOArrayProperty {
 #[pymethods]
 impl PyOArrayProperty {
     /// Create a new array property.
+    ///
+    /// Type can be a Dtype tag or a name string; see OScalarProperty.
     #[new]
     #[pyo3(signature = (name, data_type, time_sampling_index=0))]
-    fn new(name: &str, data_type: &str, time_sampling_index: u32) -> PyResult<Self> {
-        let dt = parse_data_type(data_type)
-            .ok_or_else(|| PyValueError::new_err(format!("Unknown data type: {}", data_type)))?;
-        
+    fn new(name: &str, data_type: &Bound<'_, PyAny>, time_sampling_index: u32) -> PyResult<Self> {
+        let dt = resolve_data_type(data_type)?;
+
         let mut prop = OProperty::array(name, dt);
         prop.time_sampling_index = time_sampling_index;
         
@@ -1521,18 +1867,30 @@ impl PyOArrayProperty {
     }
     
     /// Add int array sample.
-    fn addSampleInts(&mut self, values: Vec<i32>) {
-        self.inner.add_array_pod(&values);
+    ///
+    /// Accepts a flat buffer (array.array('i'), NumPy int32) for a
+    /// single-pass copy, or a list of ints.
+    fn addSampleInts(&mut self, values: &Bound<'_, PyAny>) -> PyResult<()> {
+        self.inner.add_array_pod(&extract_i32s(values)?);
+        Ok(())
     }
-    
+
     /// Add float array sample.
-    fn addSampleFloats(&mut self, values: Vec<f32>) {
-        self.inner.add_array_pod(&values);
+    ///
+    /// Accepts a flat buffer (array.array('f'), NumPy float32) for a
+    /// single-pass copy, or a list of floats.
+    fn addSampleFloats(&mut self, values: &Bound<'_, PyAny>) -> PyResult<()> {
+        self.inner.add_array_pod(&extract_f32s(values)?);
+        Ok(())
     }
-    
+
     /// Add double array sample.
-    fn addSampleDoubles(&mut self, values: Vec<f64>) {
-        self.inner.add_array_pod(&values);
+    ///
+    /// Accepts a flat buffer (array.array('d'), NumPy float64) for a
+    /// single-pass copy, or a list of floats.
+    fn addSampleDoubles(&mut self, values: &Bound<'_, PyAny>) -> PyResult<()> {
+        self.inner.add_array_pod(&extract_f64s(values)?);
+        Ok(())
     }
     
     /// Add Vec2f array sample.
@@ -1542,9 +1900,19 @@ impl PyOArrayProperty {
     }
     
     /// Add Vec3f array sample.
-    fn addSampleVec3fs(&mut self, values: Vec<[f32; 3]>) {
-        let data: &[u8] = bytemuck::cast_slice(&values);
-        self.inner.add_array_sample(data, &[values.len()]);
+    ///
+    /// Accepts a flat xyzxyz float buffer (array.array('f'), NumPy) or a
+    /// flat list; length must be a multiple of 3.
+    fn addSampleVec3fs(&mut self, values: &Bound<'_, PyAny>) -> PyResult<()> {
+        let flat = extract_f32s(values)?;
+        if flat.len() % 3 != 0 {
+            return Err(PyValueError::new_err(format!(
+                "Flat float buffer length {} is not a multiple of 3", flat.len())));
+        }
+        let count = flat.len() / 3;
+        let data: &[u8] = bytemuck::cast_slice(&flat);
+        self.inner.add_array_sample(data, &[count]);
+        Ok(())
     }
     
     /// Add Vec4f array sample.
@@ -1559,14 +1927,33 @@ impl PyOArrayProperty {
     }
     
     /// Add string array sample.
-    fn addSampleStrings(&mut self, values: Vec<String>) {
+    ///
+    /// For a list, each element's UTF-8 bytes are borrowed from CPython's
+    /// cached buffer and appended straight into the concatenated
+    /// null-terminated payload — one copy per string instead of the two an
+    /// intermediate Vec<String> would cost. Other sequences fall back to
+    /// plain extraction.
+    fn addSampleStrings(&mut self, values: &Bound<'_, PyAny>) -> PyResult<()> {
         // Strings are stored as concatenated null-terminated bytes
         let mut bytes = Vec::new();
-        for s in &values {
-            bytes.extend_from_slice(s.as_bytes());
-            bytes.push(0); // null terminator
+        let count;
+        if let Ok(list) = values.cast::<PyList>() {
+            count = list.len();
+            for item in list.iter() {
+                let s = item.cast::<PyString>()?;
+                bytes.extend_from_slice(s.to_str()?.as_bytes());
+                bytes.push(0); // null terminator
+            }
+        } else {
+            let strings: Vec<String> = values.extract()?;
+            count = strings.len();
+            for s in &strings {
+                bytes.extend_from_slice(s.as_bytes());
+                bytes.push(0);
+            }
         }
-        self.inner.add_array_sample(&bytes, &[values.len()]);
+        self.inner.add_array_sample(&bytes, &[count]);
+        Ok(())
     }
     
     fn __repr__(&self) -> String {